@@ -1,12 +1,35 @@
 """Main package initialization."""
 
-from .agents import CoordinatorAgent
-from .backend import app
-from .models import ContentType
-from .protocols import AgentProtocol, ContentProtocol, EditorialProtocol
+import importlib
+from typing import Any, List
 
 __version__ = "0.1.0"
 
+# Public names are imported on first access (PEP 562), so importing one
+# submodule such as the backend API does not load every agent
+_LAZY_IMPORTS = {
+    "CoordinatorAgent": ".agents",
+    "ContentType": ".models",
+    "app": ".backend",
+    "AgentProtocol": ".protocols",
+    "ContentProtocol": ".protocols",
+    "EditorialProtocol": ".protocols",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = [
     "CoordinatorAgent",
     "ContentType",
@@ -0,0 +1,329 @@
+"""Shared template story core for the story writer agents.
+
+Templates are split and node skeletons validated once at import; building a
+story then only copies skeletons and fills in topic-dependent text. The
+static story writer builds every story here, and the Gemini story writer
+uses it for its fallback story.
+"""
+
+import bisect
+import copy
+import functools
+import random
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from ..models.content_models import BranchedNarrative, StoryNode
+
+# Story templates
+STORY_OPENINGS = (
+    "You find yourself at the beginning of an extraordinary journey into {topic}.",
+    "As dawn breaks, you stand at the threshold of {topic}.",
+    "A mysterious force draws you toward {topic}.",
+    "The ancient texts spoke of {topic}, but nothing prepared you for this moment.",
+)
+
+PATH_DESCRIPTIONS = {
+    "bold": "Your bold approach to {topic} leads you to unexpected discoveries.",
+    "cautious": "Your careful consideration of {topic} reveals hidden details.",
+    "challenge": "The challenge tests your understanding of {topic}.",
+    "allies": "You find companions who share your interest in {topic}.",
+}
+
+ENDINGS = {
+    "victory": "Through courage and determination, you've mastered {topic}.",
+    "alliance": "Your alliance has transformed the understanding of {topic}.",
+    "wisdom": "The wisdom you've gained about {topic} becomes a beacon for others.",
+}
+
+DEFAULT_CHARACTERS = ("Protagonist", "Guide", "Antagonist")
+
+# Every generated story opens on this node; referenced as one constant so
+# the node key, its node_id and the narrative's start_node cannot drift
+_START_NODE_ID = "start"
+
+
+def _split(template: str) -> Tuple[str, ...]:
+    """Split a story template into the segments around its {topic} slots."""
+    return tuple(template.split("{topic}"))
+
+
+def _fill(segments: Tuple[str, ...], topic: str) -> str:
+    """Join pre-split template segments with the topic."""
+    return topic.join(segments)
+
+
+# Templates are split once at import so rendering is a single str.join
+_OPENING_SEGMENTS = tuple(_split(template) for template in STORY_OPENINGS)
+
+# Openings are drawn with getrandbits (see pick_opening); with a power-of-two
+# pool the first draw is always in range
+_NUM_OPENINGS = len(_OPENING_SEGMENTS)
+_OPENING_BITS = (_NUM_OPENINGS - 1).bit_length()
+
+
+# Static story graph below the opening node:
+# (minimum num_nodes, content segments, fixed StoryNode fields)
+_NODE_FIELDS = (
+    (
+        3,
+        _split(PATH_DESCRIPTIONS["bold"]),
+        {
+            "node_id": "bold_path",
+            "branches": [
+                {"text": "Face the challenge", "next_node_id": "challenge"},
+                {"text": "Find allies", "next_node_id": "allies"},
+            ],
+            "tags": ("bold",),
+            "is_ending": False,
+        },
+    ),
+    (
+        3,
+        _split(PATH_DESCRIPTIONS["cautious"]),
+        {
+            "node_id": "cautious_path",
+            "branches": [
+                {"text": "Continue alone", "next_node_id": "challenge"},
+                {"text": "Seek wisdom", "next_node_id": "wisdom_ending"},
+            ],
+            "tags": ("cautious",),
+            "is_ending": False,
+        },
+    ),
+    (
+        5,
+        _split(PATH_DESCRIPTIONS["challenge"]),
+        {
+            "node_id": "challenge",
+            "branches": [
+                {"text": "Claim victory", "next_node_id": "victory_ending"},
+            ],
+            "tags": ("challenge",),
+            "is_ending": False,
+        },
+    ),
+    (
+        5,
+        _split(PATH_DESCRIPTIONS["allies"]),
+        {
+            "node_id": "allies",
+            "branches": [
+                {"text": "Continue together", "next_node_id": "alliance_ending"},
+            ],
+            "tags": ("allies",),
+            "is_ending": False,
+        },
+    ),
+    (
+        0,
+        _split(ENDINGS["victory"]),
+        {
+            "node_id": "victory_ending",
+            "branches": [],
+            "tags": ("ending", "victory"),
+            "is_ending": True,
+        },
+    ),
+    (
+        0,
+        _split(ENDINGS["alliance"]),
+        {
+            "node_id": "alliance_ending",
+            "branches": [],
+            "tags": ("ending", "alliance"),
+            "is_ending": True,
+        },
+    ),
+    (
+        0,
+        _split(ENDINGS["wisdom"]),
+        {
+            "node_id": "wisdom_ending",
+            "branches": [],
+            "tags": ("ending", "wisdom"),
+            "is_ending": True,
+        },
+    ),
+)
+
+
+def _skeleton(**fields: Any) -> Dict[str, Any]:
+    """Validate and dump a node once, leaving its content to be filled in.
+
+    Branches and tags are frozen into tuples so the shared skeleton cannot
+    be changed through a generated node.
+    """
+    node = StoryNode(content="", **fields).model_dump()
+    node["branches"] = tuple(node["branches"])
+    node["tags"] = tuple(node["tags"])
+    return node
+
+
+def _node(skeleton: Dict[str, Any], content: str, *extra_tags: str) -> Dict[str, Any]:
+    """Copy a node skeleton with its content and fresh branch and tag lists."""
+    return {
+        **skeleton,
+        "content": content,
+        "branches": [dict(branch) for branch in skeleton["branches"]],
+        "tags": [*skeleton["tags"], *extra_tags],
+    }
+
+
+# Dumped node skeletons; per request only content (and the opening's genre
+# tag) changes, so nodes are copied from these instead of built as models
+_START_SKELETON = _skeleton(
+    node_id=_START_NODE_ID,
+    branches=[
+        {"text": "Take the bold path", "next_node_id": "bold_path"},
+        {"text": "Proceed with caution", "next_node_id": "cautious_path"},
+    ],
+    tags=("opening",),
+    is_ending=False,
+)
+_NODE_SKELETONS = tuple(
+    (min_nodes, segments, _skeleton(**fields))
+    for min_nodes, segments, fields in _NODE_FIELDS
+)
+
+# Node budgets only matter at the skeleton thresholds, so the skeletons each
+# budget includes are resolved once. Budgets below every threshold (negative
+# ones) share the bottom tier, the endings, so every story keeps its endings
+_NODE_THRESHOLDS = sorted({min_nodes for min_nodes, _, _ in _NODE_SKELETONS})
+_THRESHOLD_TIERS = tuple(
+    tuple(
+        skeleton
+        for min_nodes, _, skeleton in _NODE_SKELETONS
+        if min_nodes <= threshold
+    )
+    for threshold in _NODE_THRESHOLDS
+)
+_SKELETONS_BY_TIER = (_THRESHOLD_TIERS[0],) + _THRESHOLD_TIERS
+
+
+def _skeletons_for(num_nodes: int) -> Tuple[Dict[str, Any], ...]:
+    """Return the ordered node skeletons included for a node budget."""
+    return _SKELETONS_BY_TIER[bisect.bisect_right(_NODE_THRESHOLDS, num_nodes)]
+
+
+# Budgets up to 7 (the agents request 3, 5 and 7) resolve with one dict
+# lookup; other budgets fall back to the bisect
+_SKELETONS_BY_BUDGET = {
+    num_nodes: _skeletons_for(num_nodes)
+    for num_nodes in range(_NODE_THRESHOLDS[-1] + 3)
+}
+
+
+# Block choices mirror each skeleton's branches and never vary per request
+NODE_CHOICES = {
+    skeleton["node_id"]: tuple(
+        {"text": branch["text"], "next_block": branch["next_node_id"]}
+        for branch in skeleton["branches"]
+    )
+    for skeleton in (_START_SKELETON, *(sk for _, _, sk in _NODE_SKELETONS))
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _StoryTexts:
+    """Topic-dependent strings of a story, rendered once per topic."""
+
+    openings: Tuple[str, ...]
+    contents: Dict[str, str]
+    title: str
+
+
+@functools.lru_cache(maxsize=512)
+def _story_texts(topic: str) -> _StoryTexts:
+    """Render every topic-dependent story string for a topic.
+
+    All opening variants are rendered so the per-call random pick is a plain
+    index. The result is shared between calls and must not be modified.
+    """
+    return _StoryTexts(
+        openings=tuple(_fill(segments, topic) for segments in _OPENING_SEGMENTS),
+        contents={
+            skeleton["node_id"]: _fill(segments, topic)
+            for _, segments, skeleton in _NODE_SKELETONS
+        },
+        title="".join(("The ", topic.title(), " Chronicles")),
+    )
+
+
+# Defaults of the optional BranchedNarrative fields, captured once; mutable
+# defaults are copied per narrative so results never share them
+_NARRATIVE_DEFAULTS = {
+    name: field.get_default(call_default_factory=True)
+    for name, field in BranchedNarrative.model_fields.items()
+    if not field.is_required()
+}
+
+
+def pick_opening(rng: random.Random) -> int:
+    """Draw a uniform opening index with getrandbits, redrawing if too big."""
+    index = rng.getrandbits(_OPENING_BITS)
+    while index >= _NUM_OPENINGS:
+        index = rng.getrandbits(_OPENING_BITS)
+    return index
+
+
+def build_story(
+    topic: str, genre: str, num_nodes: int, opening: int
+) -> Dict[str, Any]:
+    """Build a story dict in the BranchedNarrative shape.
+
+    Args:
+        topic: Story topic
+        genre: Story genre
+        num_nodes: Node budget; controls which path nodes are included
+        opening: Index into STORY_OPENINGS for the opening node
+
+    Returns:
+        A fresh narrative dict; no containers are shared between stories
+    """
+    # Topic and genre recur across requests and are stored in every story
+    # (genre as the opening's tag), so keep one shared copy of each
+    topic = sys.intern(topic)
+    genre = sys.intern(genre)
+    texts = _story_texts(topic)
+
+    # Opening node; its tags carry the requested genre
+    start = _node(_START_SKELETON, texts.openings[opening], genre)
+
+    # Remaining nodes come from the static skeletons; only content varies
+    tier = _SKELETONS_BY_BUDGET.get(num_nodes)
+    if tier is None:
+        tier = _skeletons_for(num_nodes)
+    contents = texts.contents
+    nodes = {_START_NODE_ID: start}
+    nodes.update(
+        (skeleton["node_id"], _node(skeleton, contents[skeleton["node_id"]]))
+        for skeleton in tier
+    )
+
+    # Nodes are already dumped, so the narrative is assembled as a dict in
+    # the BranchedNarrative shape rather than validated again
+    narrative = {
+        "title": texts.title,
+        "synopsis": "".join(("An interactive ", genre, " story about ", topic)),
+        "genre": genre,
+        "start_node": _START_NODE_ID,
+        "nodes": nodes,
+        "characters": list(DEFAULT_CHARACTERS),
+    }
+    for name, default in _NARRATIVE_DEFAULTS.items():
+        if name not in narrative:
+            narrative[name] = copy.copy(default)
+    return narrative
+
+
+__all__ = [
+    "DEFAULT_CHARACTERS",
+    "ENDINGS",
+    "NODE_CHOICES",
+    "PATH_DESCRIPTIONS",
+    "STORY_OPENINGS",
+    "build_story",
+    "pick_opening",
+]
@@ -7,7 +7,7 @@ specialized agents and manage complex multi-agent workflows.
 import json
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from google.adk.agents import Agent
 from google.adk.models.google_llm import Gemini
@@ -110,6 +110,19 @@ Your role is to:
         self.agent_registry[agent.role].append(agent)
         logger.info(f"Registered agent {agent.agent_id} with role {agent.role}")
 
+    def register_agents(self, agents: Iterable[BaseAgent]) -> None:
+        """Register several agents with the coordinator in one pass.
+
+        Args:
+            agents: Agents to register, in registration order
+        """
+        registry = self.agent_registry
+        registered = []
+        for agent in agents:
+            registry.setdefault(agent.role, []).append(agent)
+            registered.append(agent.agent_id)
+        logger.info(f"Registered agents {', '.join(registered)}")
+
     def get_supported_tasks(self) -> List[Dict[str, Any]]:
         """Get list of supported tasks with descriptions.
 
@@ -126,6 +126,11 @@ Make the simulation accurate, intuitive, and educational."""
             # Parse result
             sim_data = json.loads(result.get("simulation_content", "{}")) if isinstance(result.get("simulation_content"), str) else result.get("simulation_content", {})
             
+            # Cheap structural check before running full model validation
+            if not (sim_data.get("variables") and sim_data.get("controls")):
+                logger.warning("Simulation response missing variables or controls")
+                return await self._generate_fallback_simulation(topic, simulation_type)
+            
             # Validate and create WebSimulation object
             variables = [SimulationVariable(**v) for v in sim_data.get("variables", [])]
             controls = [SimulationControl(**c) for c in sim_data.get("controls", [])]
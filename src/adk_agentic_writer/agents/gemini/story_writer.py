@@ -10,6 +10,7 @@ from google.adk.runners import InMemoryRunner
 
 from ...models.agent_models import AGENT_TEAM_CONFIGS, AgentRole, AgentStatus
 from ...models.content_models import BranchedNarrative, StoryNode
+from .._story_core import build_story
 from ..base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
@@ -129,7 +130,13 @@ Make the story engaging, emotionally resonant, and ensure choices have meaningfu
             
             # Parse result
             story_data = json.loads(result.get("story_content", "{}")) if isinstance(result.get("story_content"), str) else result.get("story_content", {})
-            
+
+            # Cheap structural check before running full model validation
+            nodes = story_data.get("nodes")
+            if not nodes or story_data.get("start_node", "start") not in nodes:
+                logger.warning("Story response missing nodes or its start node")
+                return await self._generate_fallback_story(topic, genre)
+
             # Validate and create BranchedNarrative object
             nodes_dict = {}
             for node_id, node_data in story_data.get("nodes", {}).items():
@@ -151,45 +158,9 @@ Make the story engaging, emotionally resonant, and ensure choices have meaningfu
             return await self._generate_fallback_story(topic, genre)
 
     async def _generate_fallback_story(self, topic: str, genre: str) -> Dict[str, Any]:
-        """Fallback story generation."""
+        """Fallback story generation from the shared template story core."""
         logger.warning("Using fallback story generation")
-        
-        nodes = {
-            "start": StoryNode(
-                node_id="start",
-                content=f"You find yourself at the beginning of an adventure about {topic}...",
-                branches=[
-                    {"text": "Take the left path", "next_node_id": "left"},
-                    {"text": "Take the right path", "next_node_id": "right"},
-                ],
-                tags=["opening"],
-                is_ending=False,
-            ),
-            "left": StoryNode(
-                node_id="left",
-                content="You chose the left path and discovered something amazing!",
-                branches=[],
-                tags=["ending", "victory"],
-                is_ending=True,
-            ),
-            "right": StoryNode(
-                node_id="right",
-                content="You chose the right path and found a different outcome!",
-                branches=[],
-                tags=["ending"],
-                is_ending=True,
-            ),
-        }
-
-        story = BranchedNarrative(
-            title=f"{topic.title()} Adventure",
-            synopsis=f"An interactive {genre} story about {topic}",
-            genre=genre,
-            start_node="start",
-            nodes=nodes,
-            characters=["Hero"],
-        )
 
-        return story.model_dump()
+        return build_story(topic, genre, num_nodes=7, opening=0)
 
 
@@ -0,0 +1,49 @@
+"""Counters for large story graphs used by the reviewer.
+
+The counters take NumPy arrays built once from the story nodes. Numba is
+optional: when installed the loops are JIT-compiled, otherwise the same
+functions run as plain Python.
+"""
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """JIT-compile a counter with Numba when installed, else return it unchanged."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+@_jit
+def count_branch_points(branch_lens: "np.ndarray") -> int:
+    """Count nodes offering more than one branch."""
+    count = 0
+    for i in range(branch_lens.shape[0]):
+        if branch_lens[i] > 1:
+            count += 1
+    return count
+
+
+@_jit
+def count_endings(is_ending: "np.ndarray") -> int:
+    """Count nodes flagged as endings."""
+    count = 0
+    for i in range(is_ending.shape[0]):
+        if is_ending[i]:
+            count += 1
+    return count
+
+
+__all__ = ["NUMBA_AVAILABLE", "count_branch_points", "count_endings"]
@@ -34,6 +34,7 @@ from ...workflows.editorial_workflows import (
 # Import actual agent implementations
 from .game_designer import GameDesignerAgent
 from .quiz_writer import StaticQuizWriterAgent
+from .reviewer import ReviewerAgent
 from .simulation_designer import SimulationDesignerAgent
 from .story_writer import StoryWriterAgent
 
@@ -47,6 +48,15 @@ CONTENT_TYPE_MAP = {
     "web_simulation": SimulationDesignerAgent,
 }
 
+# Content type to coordinator attribute holding its agent, built once instead
+# of per lookup
+_AGENT_ATTRS = {
+    "quiz": "quiz_agent",
+    "branched_narrative": "story_agent",
+    "quest_game": "game_agent",
+    "web_simulation": "simulation_agent",
+}
+
 # Content type to role mapping
 ROLE_MAP = {
     "quiz": ContentRole.QUIZ_WRITER,
@@ -103,6 +113,9 @@ class CoordinatorAgent(StatefulAgent):
         self.game_agent = GameDesignerAgent("game_designer")
         self.simulation_agent = SimulationDesignerAgent("simulation_designer")
 
+        # Reviewer is only needed by review workflows; created on first use
+        self._reviewer: Optional[ReviewerAgent] = None
+
         logger.info("Setup content teams: quiz, story, game, simulation")
 
     async def _execute_task(
@@ -179,7 +192,7 @@ class CoordinatorAgent(StatefulAgent):
         elif content_type == "branched_narrative":
             genre = parameters.get("genre", "fantasy")
             num_nodes = parameters.get("num_nodes", 7)
-            result = await agent._generate_story_data(topic, genre, num_nodes)
+            result = agent._generate_story_data(topic, genre, num_nodes)
         elif content_type == "quest_game":
             num_nodes = parameters.get("num_nodes", 7)
             difficulty = parameters.get("difficulty", "medium")
@@ -187,7 +200,7 @@ class CoordinatorAgent(StatefulAgent):
         elif content_type == "web_simulation":
             num_variables = parameters.get("num_variables", 5)
             complexity = parameters.get("complexity", "medium")
-            result = await agent._generate_simulation_data(
+            result = agent._generate_simulation_data(
                 topic, num_variables, complexity
             )
         else:
@@ -378,13 +391,14 @@ class CoordinatorAgent(StatefulAgent):
 
     def _get_agent_for_type(self, content_type: str) -> Optional[Any]:
         """Get the appropriate agent for a content type."""
-        agent_map = {
-            "quiz": self.quiz_agent,
-            "branched_narrative": self.story_agent,
-            "quest_game": self.game_agent,
-            "web_simulation": self.simulation_agent,
-        }
-        return agent_map.get(content_type)
+        attr = _AGENT_ATTRS.get(content_type)
+        return getattr(self, attr) if attr else None
+
+    def _get_reviewer(self) -> ReviewerAgent:
+        """Get the reviewer agent, creating it on first use."""
+        if self._reviewer is None:
+            self._reviewer = ReviewerAgent("reviewer")
+        return self._reviewer
 
 
 __all__ = ["CoordinatorAgent"]
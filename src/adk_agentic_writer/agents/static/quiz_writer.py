@@ -165,8 +165,10 @@ class StaticQuizWriterAgent(StatefulAgent):
         topic = context.get("topic", "general knowledge")
         questions_per_block = context.get("questions_per_block", 3)
 
+        # Precompute block ids once; navigation indexes into this list
+        ids = [f"quiz_section_{i+1}" for i in range(num_blocks)]
+
         for i in range(num_blocks):
-            block_id = f"quiz_section_{i+1}"
             section_topic = f"{topic} - Section {i+1}"
 
             quiz_data = await self._generate_quiz_data(
@@ -175,12 +177,12 @@ class StaticQuizWriterAgent(StatefulAgent):
 
             # Set up navigation
             navigation = {
-                "next": f"quiz_section_{i+2}" if i < num_blocks - 1 else None,
-                "prev": f"quiz_section_{i}" if i > 0 else None,
+                "next": ids[i + 1] if i < num_blocks - 1 else None,
+                "prev": ids[i - 1] if i > 0 else None,
             }
 
             block = ContentBlock(
-                block_id=block_id,
+                block_id=ids[i],
                 block_type=block_type,
                 content=quiz_data,
                 pattern=ContentPattern.SEQUENTIAL,
@@ -205,9 +207,10 @@ class StaticQuizWriterAgent(StatefulAgent):
         blocks = []
         topic = context.get("topic", "general knowledge")
 
-        for i in range(num_blocks):
-            block_id = f"practice_quiz_{i+1}"
+        # Precompute block ids once; the last block loops back to the first
+        ids = [f"practice_quiz_{i+1}" for i in range(num_blocks)]
 
+        for i in range(num_blocks):
             quiz_data = await self._generate_quiz_data(
                 topic,
                 context.get("num_questions", 3),
@@ -216,13 +219,13 @@ class StaticQuizWriterAgent(StatefulAgent):
 
             # Set up loop navigation
             navigation = {
-                "next": f"practice_quiz_{(i+1) % num_blocks + 1}",  # Loop back
-                "prev": f"practice_quiz_{i}" if allow_back and i > 0 else None,
+                "next": ids[(i + 1) % num_blocks],  # Loop back
+                "prev": ids[i - 1] if allow_back and i > 0 else None,
                 "exit": "check_exit_condition",
             }
 
             block = ContentBlock(
-                block_id=block_id,
+                block_id=ids[i],
                 block_type=block_type,
                 content=quiz_data,
                 pattern=ContentPattern.LOOPED,
@@ -411,10 +414,14 @@ class StaticQuizWriterAgent(StatefulAgent):
             options = []
             used_combinations = set()
 
+            # Draw all four option parts up front; redraw only on collision
+            prefixes = random.choices(OPTION_PREFIXES, k=4)
+            suffixes = random.choices(OPTION_SUFFIXES, k=4)
+
             for j in range(4):
                 # Create unique option combinations
-                prefix = random.choice(OPTION_PREFIXES)
-                suffix = random.choice(OPTION_SUFFIXES)
+                prefix = prefixes[j]
+                suffix = suffixes[j]
                 combo = f"{prefix}, {suffix}"
 
                 # Ensure uniqueness
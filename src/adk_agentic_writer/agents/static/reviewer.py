@@ -6,12 +6,27 @@ This agent reviews and improves content using:
 - Quality criteria: Customizable review standards
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
 
 from ...agents.stateful_agent import StatefulAgent
 from ...models.agent_models import AgentTask, AgentStatus
 from ...teams.content_team import CONTENT_WRITER
+from ._story_stats import NUMBA_AVAILABLE, count_branch_points, count_endings
+
+# NumPy is optional and only used to scan large content; every use is
+# guarded by _NUMPY_AVAILABLE
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -19,46 +34,138 @@ logger = logging.getLogger(__name__)
 REVIEW_CRITERIA = {
     "clarity": {
         "name": "Clarity",
-        "checks": [
+        "checks": (
             "Is the content easy to understand?",
             "Are concepts explained clearly?",
             "Is terminology appropriate for the audience?",
-        ],
+        ),
     },
     "engagement": {
         "name": "Engagement",
-        "checks": [
+        "checks": (
             "Is the content interesting and engaging?",
             "Does it maintain reader interest?",
             "Are examples and illustrations compelling?",
-        ],
+        ),
     },
     "accuracy": {
         "name": "Accuracy",
-        "checks": [
+        "checks": (
             "Is the information factually correct?",
             "Are there any inconsistencies?",
             "Is the content appropriate for the topic?",
-        ],
+        ),
     },
     "structure": {
         "name": "Structure",
-        "checks": [
+        "checks": (
             "Is the content well-organized?",
             "Does it flow logically?",
             "Are transitions smooth?",
-        ],
+        ),
     },
     "completeness": {
         "name": "Completeness",
-        "checks": [
+        "checks": (
             "Does it cover all necessary points?",
             "Are there any gaps?",
             "Is the depth appropriate?",
-        ],
+        ),
     },
 }
 
+# Read-only views over REVIEW_CRITERIA used on the evaluation hot path
+_CHECKS_BY_CRITERION = MappingProxyType(
+    {name: tuple(info["checks"]) for name, info in REVIEW_CRITERIA.items()}
+)
+_CRITERION_NAMES = frozenset(REVIEW_CRITERIA)
+
+# Maximum number of suggestions returned by a review
+MAX_SUGGESTIONS = 5
+
+# Maximum number of cached criterion evaluations per reviewer
+EVALUATION_CACHE_SIZE = 512
+
+# Question/node count above which structural scans switch to NumPy
+VECTORIZE_THRESHOLD = 64
+
+# Shared default for missing node sequences; avoids allocating [] per lookup
+_EMPTY: tuple = ()
+
+# Story node count above which the Numba counters beat NumPy reductions
+JIT_THRESHOLD = 256
+
+# Structural keys that must be present before an evaluation is cached
+_CACHEABLE_KEYS = {
+    "quiz": ("questions",),
+    "branched_narrative": ("nodes", "start_node"),
+    "story": ("nodes", "start_node"),
+    "quest_game": ("nodes", "start_node"),
+}
+
+
+# Keys whose presence determines the detected content type; the position of
+# each key is its bit in the content signature
+_SIGNATURE_KEYS = (
+    "questions",
+    "nodes",
+    "start_node",
+    "victory_conditions",
+    "variables",
+    "controls",
+)
+
+
+def _validate_quiz(content: Dict[str, Any]) -> bool:
+    """Quiz content is valid when it has at least one question."""
+    return len(content.get("questions", [])) > 0
+
+
+def _validate_structure(content: Dict[str, Any]) -> bool:
+    """Story, game and simulation signatures already imply their required keys."""
+    return True
+
+
+def _validate_general(content: Dict[str, Any]) -> bool:
+    """General content is valid when it is non-empty."""
+    return len(content) > 0
+
+
+def _detect_signature(
+    present: frozenset,
+) -> tuple[str, Callable[[Dict[str, Any]], bool]]:
+    """Map a set of present signature keys to (content_type, validator)."""
+    if "questions" in present:
+        return "quiz", _validate_quiz
+    if "nodes" in present and "start_node" in present:
+        if "victory_conditions" in present:
+            return "game", _validate_structure
+        return "story", _validate_structure
+    if "variables" in present and "controls" in present:
+        return "simulation", _validate_structure
+    return "general", _validate_general
+
+
+# (content_type, validator) for every signature bitmask, resolved at import time
+_TYPE_TABLE = tuple(
+    _detect_signature(
+        frozenset(key for bit, key in enumerate(_SIGNATURE_KEYS) if mask >> bit & 1)
+    )
+    for mask in range(1 << len(_SIGNATURE_KEYS))
+)
+
+
+def _content_signature(content: Dict[str, Any]) -> int:
+    """Compute the signature bitmask of the keys present in content."""
+    return (
+        ("questions" in content)
+        | ("nodes" in content) << 1
+        | ("start_node" in content) << 2
+        | ("victory_conditions" in content) << 3
+        | ("variables" in content) << 4
+        | ("controls" in content) << 5
+    )
+
 
 class ReviewerAgent(StatefulAgent):
     """Reviewer agent implementing EditorialProtocol.
@@ -76,6 +183,17 @@ class ReviewerAgent(StatefulAgent):
             agent_id=agent_id,
             config=CONTENT_WRITER,  # Use content writer config as base
         )
+        # LRU cache of (content_type, criterion, digest) -> (score, feedback)
+        self._evaluation_cache: OrderedDict[tuple, tuple[float, List[str]]] = (
+            OrderedDict()
+        )
+        # Content type -> evaluator; anything else uses _evaluate_general
+        self._evaluators = {
+            "quiz": self._evaluate_quiz,
+            "branched_narrative": self._evaluate_story,
+            "story": self._evaluate_story,
+            "quest_game": self._evaluate_game,
+        }
         logger.info(f"Initialized ReviewerAgent {agent_id}")
 
     async def _execute_task(
@@ -120,26 +238,35 @@ class ReviewerAgent(StatefulAgent):
 
         # Analyze content
         scores = {}
-        suggestions = []
+        suggestions: List[str] = []
         issues = []
 
-        for criterion in criteria:
-            if criterion in REVIEW_CRITERIA:
-                # Evaluate based on criterion
-                score, feedback = await self._evaluate_criterion(
-                    content, content_type, criterion
+        # Evaluate criteria concurrently; gather preserves order. The content
+        # is hashed once for the evaluation cache and shared by every criterion
+        evaluated = [c for c in criteria if c in _CRITERION_NAMES]
+        digest = self._content_digest(content, content_type) if evaluated else b""
+        results = await asyncio.gather(
+            *(
+                self._evaluate_criterion(content, content_type, criterion, digest)
+                for criterion in evaluated
+            )
+        )
+
+        for criterion, (score, feedback) in zip(evaluated, results):
+            scores[criterion] = score
+
+            if score < 7:  # Below threshold
+                issues.append(
+                    {
+                        "criterion": criterion,
+                        "score": score,
+                        "feedback": feedback,
+                    }
                 )
-                scores[criterion] = score
-
-                if score < 7:  # Below threshold
-                    issues.append(
-                        {
-                            "criterion": criterion,
-                            "score": score,
-                            "feedback": feedback,
-                        }
-                    )
-                    suggestions.extend(feedback)
+                # Collect only up to the reported number of suggestions
+                remaining = MAX_SUGGESTIONS - len(suggestions)
+                if remaining > 0:
+                    suggestions.extend(feedback[:remaining])
 
         # Calculate overall score
         overall_score = sum(scores.values()) / len(scores) if scores else 0
@@ -151,7 +278,7 @@ class ReviewerAgent(StatefulAgent):
             "status": status,
             "overall_score": round(overall_score, 2),
             "scores": scores,
-            "suggestions": suggestions[:5],  # Top 5 suggestions
+            "suggestions": suggestions,  # Top MAX_SUGGESTIONS suggestions
             "issues": issues,
             "content_type": content_type,
             "reviewed": True,
@@ -191,6 +318,30 @@ class ReviewerAgent(StatefulAgent):
         # Use existing internal review method
         return await self._review_content(content, content_type, criteria)
 
+    async def review_batch(
+        self,
+        items: List[Dict[str, Any]],
+        review_criteria: Dict[str, Any],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Review several content items concurrently.
+
+        Args:
+            items: Content items to review
+            review_criteria: Criteria applied to every item (see review_content)
+            max_concurrency: Maximum number of reviews running at once
+
+        Returns:
+            Review results, positionally aligned with items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _review_one(content: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.review_content(content, review_criteria)
+
+        return list(await asyncio.gather(*(_review_one(c) for c in items)))
+
     async def validate_content(self, content: Dict[str, Any]) -> bool:
         """Validate generated content.
 
@@ -207,29 +358,10 @@ class ReviewerAgent(StatefulAgent):
         if not content:
             return False
 
-        # Detect content type
-        if "questions" in content:
-            content_type = "quiz"
-        elif "nodes" in content and "start_node" in content:
-            if "victory_conditions" in content:
-                content_type = "game"
-            else:
-                content_type = "story"
-        elif "variables" in content and "controls" in content:
-            content_type = "simulation"
-        else:
-            content_type = "general"
-
-        # Validate based on type
-        if content_type == "quiz":
-            return "questions" in content and len(content.get("questions", [])) > 0
-        elif content_type in ["story", "game"]:
-            return "nodes" in content and "start_node" in content
-        elif content_type == "simulation":
-            return "variables" in content and "controls" in content
-
-        # Default validation
-        return len(content) > 0
+        # Detect content type and validate with a single table lookup
+        content_type, validator = _TYPE_TABLE[_content_signature(content)]
+        logger.debug(f"Detected {content_type} content")
+        return validator(content)
 
     async def refine_content(
         self, content: Dict[str, Any], feedback: str | Dict[str, Any]
@@ -255,24 +387,26 @@ class ReviewerAgent(StatefulAgent):
             issues = []
             suggestions = [{"area": "general", "suggestion": str(feedback)}]
 
-        # Create refined copy
-        refined_content = content.copy()
+        # Refinements only touch metadata, so build just that dict and overlay
+        # it on the original content; the input content is left untouched
+        metadata = dict(content.get("metadata") or {})
+        touched = False
 
         # Apply refinements based on suggestions
         for suggestion in suggestions:
             area = suggestion.get("area", "general")
 
-            if area == "completeness" and isinstance(refined_content, dict):
+            if area == "completeness":
                 # Add metadata to indicate refinement
-                if "metadata" not in refined_content:
-                    refined_content["metadata"] = {}
-                refined_content["metadata"]["refined"] = True
-                refined_content["metadata"]["refinement_applied"] = "completeness"
+                metadata["refined"] = True
+                metadata["refinement_applied"] = "completeness"
+                touched = True
 
             elif area == "clarity":
-                if "metadata" not in refined_content:
-                    refined_content["metadata"] = {}
-                refined_content["metadata"]["clarity_improved"] = True
+                metadata["clarity_improved"] = True
+                touched = True
+
+        refined_content = {**content, "metadata": metadata} if touched else {**content}
 
         logger.info(f"Content refined: {len(suggestions)} improvements applied")
         return refined_content
@@ -282,42 +416,69 @@ class ReviewerAgent(StatefulAgent):
     # ========================================================================
 
     async def _evaluate_criterion(
-        self, content: Dict[str, Any], content_type: str, criterion: str
+        self,
+        content: Dict[str, Any],
+        content_type: str,
+        criterion: str,
+        digest: Optional[bytes] = None,
     ) -> tuple[float, List[str]]:
         """Evaluate content against specific criterion.
 
+        Results are cached by content digest, so unchanged content is not
+        re-evaluated across refine/review cycles.
+
+        Args:
+            content: Content to evaluate
+            content_type: Type of content
+            criterion: Criterion to evaluate
+            digest: Digest from _content_digest, so a review hashes its
+                content once for all criteria; computed here if omitted
+
         Returns:
             Tuple of (score, feedback_list)
         """
-        feedback = []
-        base_score = 8.0  # Start optimistic
-
-        criterion_info = REVIEW_CRITERIA.get(criterion, {})
-        checks = criterion_info.get("checks", [])
-
-        # Content type specific evaluations
-        if content_type == "quiz":
-            score, fb = await self._evaluate_quiz(content, criterion, checks)
-            base_score = score
-            feedback.extend(fb)
-        elif content_type in ["branched_narrative", "story"]:
-            score, fb = await self._evaluate_story(content, criterion, checks)
-            base_score = score
-            feedback.extend(fb)
-        elif content_type == "quest_game":
-            score, fb = await self._evaluate_game(content, criterion, checks)
-            base_score = score
-            feedback.extend(fb)
-        else:
-            # General content evaluation
-            score, fb = await self._evaluate_general(content, criterion, checks)
-            base_score = score
-            feedback.extend(fb)
+        if digest is None:
+            digest = self._content_digest(content, content_type)
+        cache_key = (content_type, criterion, digest) if digest else None
+        if cache_key is not None:
+            cached = self._evaluation_cache.get(cache_key)
+            if cached is not None:
+                self._evaluation_cache.move_to_end(cache_key)
+                return cached[0], list(cached[1])
+
+        checks = _CHECKS_BY_CRITERION.get(criterion, ())
+
+        # Content type specific evaluation
+        evaluator = self._evaluators.get(content_type, self._evaluate_general)
+        base_score, feedback = await evaluator(content, criterion, checks)
+
+        if cache_key is not None:
+            if len(self._evaluation_cache) >= EVALUATION_CACHE_SIZE:
+                self._evaluation_cache.popitem(last=False)
+            self._evaluation_cache[cache_key] = (base_score, list(feedback))
 
         return base_score, feedback
 
+    def _content_digest(self, content: Dict[str, Any], content_type: str) -> bytes:
+        """Digest content for the evaluation cache.
+
+        Returns:
+            Content digest, or b"" if the content lacks the structural keys
+            required for its type or cannot be serialized with sorted keys
+            (e.g. mixed-type dict keys), in which case the cache is bypassed
+        """
+        required = _CACHEABLE_KEYS.get(content_type)
+        if not required or not all(key in content for key in required):
+            return b""
+
+        try:
+            encoded = json.dumps(content, sort_keys=True, default=str).encode()
+        except (TypeError, ValueError):
+            return b""
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
     async def _evaluate_quiz(
-        self, content: Dict[str, Any], criterion: str, checks: List[str]
+        self, content: Dict[str, Any], criterion: str, checks: tuple[str, ...]
     ) -> tuple[float, List[str]]:
         """Evaluate quiz content."""
         feedback = []
@@ -342,9 +503,26 @@ class ReviewerAgent(StatefulAgent):
 
         elif criterion == "engagement":
             # Check question variety
-            if len(questions) > 0 and len(
-                set(q.get("question", "")[:20] for q in questions)
-            ) < len(questions):
+            if _NUMPY_AVAILABLE and len(questions) > VECTORIZE_THRESHOLD:
+                prefixes = np.fromiter(
+                    (q.get("question", "")[:20] for q in questions),
+                    dtype=object,
+                    count=len(questions),
+                )
+                has_duplicate = len(np.unique(prefixes)) < len(questions)
+            else:
+                # Stop at the first repeated prefix instead of building the full set
+                seen: set[str] = set()
+                add_seen = seen.add
+                has_duplicate = False
+                for q in questions:
+                    prefix = q.get("question", "")[:20]
+                    if prefix in seen:
+                        has_duplicate = True
+                        break
+                    add_seen(prefix)
+
+            if has_duplicate:
                 feedback.append("Vary question formats for better engagement")
                 score -= 0.5
 
@@ -358,7 +536,7 @@ class ReviewerAgent(StatefulAgent):
         return max(score, 1.0), feedback
 
     async def _evaluate_story(
-        self, content: Dict[str, Any], criterion: str, checks: List[str]
+        self, content: Dict[str, Any], criterion: str, checks: tuple[str, ...]
     ) -> tuple[float, List[str]]:
         """Evaluate story content."""
         feedback = []
@@ -381,16 +559,42 @@ class ReviewerAgent(StatefulAgent):
 
         elif criterion == "engagement":
             # Check branching
-            branch_count = sum(
-                1 for node in nodes.values() if len(node.get("branches", [])) > 1
-            )
+            if _NUMPY_AVAILABLE and len(nodes) > VECTORIZE_THRESHOLD:
+                branch_lens = np.fromiter(
+                    (len(node.get("branches", _EMPTY)) for node in nodes.values()),
+                    dtype=np.int32,
+                    count=len(nodes),
+                )
+                if NUMBA_AVAILABLE and len(nodes) > JIT_THRESHOLD:
+                    branch_count = int(count_branch_points(branch_lens))
+                else:
+                    branch_count = int((branch_lens > 1).sum())
+            else:
+                branch_count = 0
+                for node in nodes.values():
+                    if len(node.get("branches", _EMPTY)) > 1:
+                        branch_count += 1
             if branch_count < 2:
                 feedback.append("Add more branching points for interactivity")
                 score -= 1.0
 
         elif criterion == "completeness":
             # Check for endings
-            endings = sum(1 for node in nodes.values() if node.get("is_ending", False))
+            if _NUMPY_AVAILABLE and len(nodes) > VECTORIZE_THRESHOLD:
+                is_ending = np.fromiter(
+                    (node.get("is_ending", False) for node in nodes.values()),
+                    dtype=bool,
+                    count=len(nodes),
+                )
+                if NUMBA_AVAILABLE and len(nodes) > JIT_THRESHOLD:
+                    endings = int(count_endings(is_ending))
+                else:
+                    endings = int(is_ending.sum())
+            else:
+                endings = 0
+                for node in nodes.values():
+                    if node.get("is_ending", False):
+                        endings += 1
             if endings < 2:
                 feedback.append("Add multiple endings for replay value")
                 score -= 0.5
@@ -398,7 +602,7 @@ class ReviewerAgent(StatefulAgent):
         return max(score, 1.0), feedback
 
     async def _evaluate_game(
-        self, content: Dict[str, Any], criterion: str, checks: List[str]
+        self, content: Dict[str, Any], criterion: str, checks: tuple[str, ...]
     ) -> tuple[float, List[str]]:
         """Evaluate game content."""
         feedback = []
@@ -412,12 +616,15 @@ class ReviewerAgent(StatefulAgent):
                 score = 7.0
 
         elif criterion == "engagement":
-            # Check reward variety
-            all_rewards = []
+            # Check reward variety; rewards are arbitrary hashable values, so
+            # they are counted with a set at every size
+            reward_set: set[Any] = set()
+            add_rewards = reward_set.update
             for node in nodes.values():
-                all_rewards.extend(node.get("rewards", []))
+                add_rewards(node.get("rewards", _EMPTY))
+            unique_rewards = len(reward_set)
 
-            if len(set(all_rewards)) < 3:
+            if unique_rewards < 3:
                 feedback.append("Add more varied rewards")
                 score -= 1.0
 
@@ -429,7 +636,7 @@ class ReviewerAgent(StatefulAgent):
         return max(score, 1.0), feedback
 
     async def _evaluate_general(
-        self, content: Dict[str, Any], criterion: str, checks: List[str]
+        self, content: Dict[str, Any], criterion: str, checks: tuple[str, ...]
     ) -> tuple[float, List[str]]:
         """Evaluate general content."""
         feedback = []
@@ -6,33 +6,135 @@ This agent generates web simulations using:
 - ContentProtocol: Standard content generation methods
 """
 
+import functools
 import logging
 import random
-from typing import Any, Dict, List, Optional
+import re
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ...agents.stateful_agent import StatefulAgent
 from ...models.agent_models import AgentTask, AgentStatus
-from ...models.content_models import WebSimulation, SimulationVariable
+from ...models.content_models import SimulationControl
 from ...protocols.content_protocol import ContentBlock, ContentBlockType, ContentPattern
 from ...teams.content_team import SIMULATION_WRITER
 
 logger = logging.getLogger(__name__)
 
 # Simulation templates
-SIMULATION_INTROS = [
+SIMULATION_INTROS = (
     "Interactive simulation exploring {topic}",
     "Hands-on model demonstrating {topic}",
     "Dynamic simulation of {topic} concepts",
-]
+)
+
+VARIABLE_TYPES = MappingProxyType(
+    {
+        "physics": ("mass", "velocity", "acceleration", "force", "energy"),
+        "chemistry": ("temperature", "pressure", "volume", "concentration", "pH"),
+        "biology": ("population", "growth_rate", "resources", "predators", "prey"),
+        "economics": ("price", "demand", "supply", "cost", "revenue"),
+    }
+)
+
+INTERACTION_TYPES = ("slider", "button", "input", "toggle", "dropdown")
+
+
+# Units of measurement per variable name; unknown variables use "units"
+_UNITS = MappingProxyType(
+    {
+        "mass": "kg",
+        "velocity": "m/s",
+        "acceleration": "m/s²",
+        "force": "N",
+        "energy": "J",
+        "temperature": "°C",
+        "pressure": "Pa",
+        "volume": "L",
+        "concentration": "mol/L",
+        "pH": "",
+        "population": "individuals",
+        "growth_rate": "%",
+        "resources": "units",
+        "price": "$",
+        "demand": "units",
+        "supply": "units",
+    }
+)
+
+# Per-domain variable counts, used to cap sample sizes
+_VARIABLE_COUNTS = {domain: len(names) for domain, names in VARIABLE_TYPES.items()}
+
+# Initial value for each sample position; samples never exceed a domain's size
+_INITIAL_VALUES = tuple(50.0 + i * 10 for i in range(max(_VARIABLE_COUNTS.values())))
+
+# Single-pass matcher for the domain names in VARIABLE_TYPES
+_DOMAIN_RE = re.compile("|".join(map(re.escape, VARIABLE_TYPES)))
+
+
+def _classify_topic(topic: str) -> str:
+    """Return the VARIABLE_TYPES domain for a topic, defaulting to physics.
+
+    When a topic mentions several domains, the earliest mention wins.
+    """
+    match = _DOMAIN_RE.search(topic.lower())
+    return match.group(0) if match else "physics"
+
+
+# Value range shared by all generated variables
+VARIABLE_MIN = 0.0
+VARIABLE_MAX = 100.0
+
+# Slider step: 100 increments across the range, or 1.0 for a degenerate range
+CONTROL_STEP = (
+    (VARIABLE_MAX - VARIABLE_MIN) / 100.0 if VARIABLE_MAX > VARIABLE_MIN else 1.0
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_label(var_name: str) -> str:
+    """Format a variable name as a human-readable control label."""
+    return var_name.replace("_", " ").title()
+
 
-VARIABLE_TYPES = {
-    "physics": ["mass", "velocity", "acceleration", "force", "energy"],
-    "chemistry": ["temperature", "pressure", "volume", "concentration", "pH"],
-    "biology": ["population", "growth_rate", "resources", "predators", "prey"],
-    "economics": ["price", "demand", "supply", "cost", "revenue"],
+@functools.lru_cache(maxsize=256)
+def _format_intro(index: int, topic: str) -> str:
+    """Format the SIMULATION_INTROS template at index for a topic."""
+    return SIMULATION_INTROS[index].format(topic=topic)
+
+
+def _build_control(var_name: str) -> SimulationControl:
+    """Build the slider control for a simulation variable."""
+    return SimulationControl(
+        control_id=f"ctrl_{var_name}",
+        label=_format_label(var_name),
+        type="slider",
+        affects=[var_name],
+        parameters={"min": VARIABLE_MIN, "max": VARIABLE_MAX, "step": CONTROL_STEP},
+    )
+
+
+# Controls and rules depend only on the variable name, so they are validated
+# and dumped once here; generated simulations copy the control templates
+_CONTROLS_BY_VARIABLE = {
+    var_name: _build_control(var_name).model_dump()
+    for var_names in VARIABLE_TYPES.values()
+    for var_name in var_names
 }
+_RULES_BY_VARIABLE = {
+    var_name: f"{var_name} affects outcome based on its value"
+    for var_name in _CONTROLS_BY_VARIABLE
+}
+
 
-INTERACTION_TYPES = ["slider", "button", "input", "toggle", "dropdown"]
+def _control(var_name: str) -> Dict[str, Any]:
+    """Copy the control template for a variable into a fresh dict."""
+    template = _CONTROLS_BY_VARIABLE[var_name]
+    return {
+        **template,
+        "affects": list(template["affects"]),
+        "parameters": dict(template["parameters"]),
+    }
 
 
 class SimulationDesignerAgent(StatefulAgent):
@@ -49,6 +151,8 @@ class SimulationDesignerAgent(StatefulAgent):
             agent_id=agent_id,
             config=SIMULATION_WRITER,
         )
+        # Per-agent generator keeps concurrent agents' random state isolated
+        self._rng = random.Random()
         logger.info(f"Initialized SimulationDesignerAgent {agent_id}")
 
     async def _execute_task(
@@ -69,7 +173,7 @@ class SimulationDesignerAgent(StatefulAgent):
             return {"blocks": [b.content for b in blocks]}
         else:
             # Default: generate simulation
-            return await self._generate_simulation_content(resolved_prompt, context)
+            return self._generate_simulation_content(resolved_prompt, context)
 
     # ========================================================================
     # ContentProtocol Implementation
@@ -85,7 +189,7 @@ class SimulationDesignerAgent(StatefulAgent):
         topic = context.get("topic", "physics")
         num_variables = context.get("num_variables", 5)
 
-        simulation_data = await self._generate_simulation_data(
+        simulation_data = self._generate_simulation_data(
             topic, num_variables, "medium"
         )
 
@@ -103,28 +207,44 @@ class SimulationDesignerAgent(StatefulAgent):
         context: Dict[str, Any],
     ) -> List[ContentBlock]:
         """Generate sequential simulation modules."""
-        blocks = []
+        return [
+            block
+            async for block in self.iter_sequential_blocks(
+                num_blocks, block_type, context
+            )
+        ]
+
+    async def iter_sequential_blocks(
+        self,
+        num_blocks: int,
+        block_type: ContentBlockType,
+        context: Dict[str, Any],
+    ) -> AsyncIterator[ContentBlock]:
+        """Yield sequential simulation modules as soon as each is built.
+
+        Streaming consumers can forward blocks without waiting for the whole
+        sequence; generate_sequential_blocks collects the same blocks.
+        """
         topic = context.get("topic", "physics")
+        domain = _classify_topic(topic)
+
+        # Precompute block ids and their neighbours once for navigation
+        ids = [f"module_{i+1}" for i in range(num_blocks)]
+        next_ids = ids[1:] + [None]
+        prev_ids = [None] + ids[:-1]
 
         for i in range(num_blocks):
-            module_topic = f"{topic} - Module {i+1}"
-            simulation_data = await self._generate_simulation_data(
-                module_topic, 3, "medium"
+            simulation_data = self._generate_simulation_data(
+                f"{topic} - Module {i+1}", 3, "medium", domain=domain
             )
 
-            block = ContentBlock(
-                block_id=f"module_{i+1}",
+            yield ContentBlock(
+                block_id=ids[i],
                 block_type=block_type,
                 content=simulation_data,
                 pattern=ContentPattern.SEQUENTIAL,
-                navigation={
-                    "next": f"module_{i+2}" if i < num_blocks - 1 else None,
-                    "prev": f"module_{i}" if i > 0 else None,
-                },
+                navigation={"next": next_ids[i], "prev": prev_ids[i]},
             )
-            blocks.append(block)
-
-        return blocks
 
     async def generate_looped_blocks(
         self,
@@ -135,27 +255,36 @@ class SimulationDesignerAgent(StatefulAgent):
         allow_back: bool = True,
     ) -> List[ContentBlock]:
         """Generate looped simulation blocks (e.g., experiments)."""
-        blocks = []
         topic = context.get("topic", "physics")
+        domain = _classify_topic(topic)
 
-        for i in range(num_blocks):
-            simulation_data = await self._generate_simulation_data(topic, 3, "medium")
+        # Generate all experiment simulations first, then wrap them in blocks
+        sim_datas = [
+            self._generate_simulation_data(topic, 3, "medium", domain=domain)
+            for _ in range(num_blocks)
+        ]
 
-            block = ContentBlock(
-                block_id=f"experiment_{i+1}",
+        # Precompute block ids and their neighbours once; the last block
+        # loops back to the first
+        ids = [f"experiment_{i+1}" for i in range(num_blocks)]
+        next_ids = ids[1:] + ids[:1]
+        prev_ids = [None] + ids[:-1] if allow_back else [None] * num_blocks
+
+        return [
+            ContentBlock(
+                block_id=ids[i],
                 block_type=block_type,
                 content=simulation_data,
                 pattern=ContentPattern.LOOPED,
                 navigation={
-                    "next": f"experiment_{(i+1) % num_blocks + 1}",
-                    "prev": f"experiment_{i}" if allow_back and i > 0 else None,
+                    "next": next_ids[i],
+                    "prev": prev_ids[i],
                     "exit": "check_exit_condition",
                 },
                 exit_condition=exit_condition,
             )
-            blocks.append(block)
-
-        return blocks
+            for i, simulation_data in enumerate(sim_datas)
+        ]
 
     async def generate_branched_blocks(
         self,
@@ -163,11 +292,21 @@ class SimulationDesignerAgent(StatefulAgent):
         context: Dict[str, Any],
     ) -> List[ContentBlock]:
         """Generate branched simulation blocks (e.g., scenario variations)."""
-        blocks = []
         topic = context.get("topic", "physics")
+        domain = _classify_topic(topic)
+        scenarios = ("basic", "advanced")
+
+        # Main simulation and its variations, generated before any block
+        main_sim = self._generate_simulation_data(
+            topic, 4, "medium", domain=domain
+        )
+        scenario_sims = [
+            self._generate_simulation_data(
+                f"{topic} ({scenario})", 3, scenario, domain=domain
+            )
+            for scenario in scenarios
+        ]
 
-        # Main simulation
-        main_sim = await self._generate_simulation_data(topic, 4, "medium")
         main_block = ContentBlock(
             block_id="main_simulation",
             block_type=ContentBlockType.CUSTOM,
@@ -178,22 +317,16 @@ class SimulationDesignerAgent(StatefulAgent):
                 {"text": "Advanced scenario", "next_block": "advanced"},
             ],
         )
-        blocks.append(main_block)
 
-        # Variations
-        for scenario in ["basic", "advanced"]:
-            sim_data = await self._generate_simulation_data(
-                f"{topic} ({scenario})", 3, scenario
-            )
-            block = ContentBlock(
+        return [main_block] + [
+            ContentBlock(
                 block_id=scenario,
                 block_type=ContentBlockType.CUSTOM,
                 content=sim_data,
                 pattern=ContentPattern.BRANCHED,
             )
-            blocks.append(block)
-
-        return blocks
+            for scenario, sim_data in zip(scenarios, scenario_sims)
+        ]
 
     async def generate_conditional_blocks(
         self,
@@ -201,29 +334,33 @@ class SimulationDesignerAgent(StatefulAgent):
         context: Dict[str, Any],
     ) -> List[ContentBlock]:
         """Generate conditional simulation blocks."""
-        blocks = []
         topic = context.get("topic", "physics")
+        domain = _classify_topic(topic)
 
-        for config in blocks_config:
-            condition = config.get("condition", {})
-            simulation_data = await self._generate_simulation_data(topic, 3, "medium")
+        # Generate one simulation per config first, then wrap them in blocks
+        sim_datas = [
+            self._generate_simulation_data(topic, 3, "medium", domain=domain)
+            for _ in blocks_config
+        ]
 
-            block = ContentBlock(
-                block_id=config.get("block_id", f"conditional_{len(blocks)}"),
+        return [
+            ContentBlock(
+                block_id=config.get("block_id", f"conditional_{i}"),
                 block_type=ContentBlockType.CUSTOM,
                 content=simulation_data,
                 pattern=ContentPattern.CONDITIONAL,
-                metadata={"display_condition": condition},
+                metadata={"display_condition": config.get("condition", {})},
             )
-            blocks.append(block)
-
-        return blocks
+            for i, (config, simulation_data) in enumerate(
+                zip(blocks_config, sim_datas)
+            )
+        ]
 
     # ========================================================================
     # Helper Methods
     # ========================================================================
 
-    async def _generate_simulation_content(
+    def _generate_simulation_content(
         self, resolved_prompt: str, context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate simulation content from resolved prompt."""
@@ -231,124 +368,80 @@ class SimulationDesignerAgent(StatefulAgent):
         num_variables = context.get("num_variables", 5)
         complexity = context.get("complexity", "medium")
 
-        return await self._generate_simulation_data(topic, num_variables, complexity)
+        return self._generate_simulation_data(topic, num_variables, complexity)
 
-    async def _generate_simulation_data(
-        self, topic: str, num_variables: int, complexity: str
+    def _generate_simulation_data(
+        self,
+        topic: str,
+        num_variables: int,
+        complexity: str,
+        domain: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Generate web simulation data."""
+        """Generate web simulation data.
+
+        Args:
+            topic: Simulation topic
+            num_variables: Maximum number of variables to include
+            complexity: Complexity label stored in metadata
+            domain: Precomputed VARIABLE_TYPES domain; classified from the
+                topic when omitted
+        """
         logger.info(
             f"Generating simulation: {topic}, variables: {num_variables}, complexity: {complexity}"
         )
 
         # Determine domain
-        domain = "physics"
-        topic_lower = topic.lower()
-        for key in VARIABLE_TYPES.keys():
-            if key in topic_lower:
-                domain = key
-                break
+        if domain is None:
+            domain = _classify_topic(topic)
 
         # Generate variables
-        variables = []
-        available_vars = VARIABLE_TYPES.get(domain, VARIABLE_TYPES["physics"])
-        selected_vars = random.sample(
-            available_vars, min(num_variables, len(available_vars))
+        available_vars = VARIABLE_TYPES[domain]
+        count = _VARIABLE_COUNTS[domain]
+        selected_vars = self._rng.sample(
+            available_vars, num_variables if num_variables < count else count
         )
 
-        for i, var_name in enumerate(selected_vars):
-            var = SimulationVariable(
-                name=var_name,
-                initial_value=50.0 + i * 10,
-                min_value=0.0,
-                max_value=100.0,
-                unit=self._get_unit(var_name),
-            )
-            variables.append(var.model_dump())
-
-        # Generate controls
-        controls = []
-        for i, var_name in enumerate(selected_vars[:3]):  # Max 3 controls
-            controls.append(
-                {
-                    "id": f"control_{var_name}",
-                    "type": random.choice(INTERACTION_TYPES),
-                    "label": f"Adjust {var_name}",
-                    "variable": var_name,
-                }
-            )
-
-        # Create simulation
-        from ...models.content_models import SimulationControl
-
-        description = random.choice(SIMULATION_INTROS).format(topic=topic)
-
-        # Create controls for variables
-        controls = []
-        for var in variables:
-            control = SimulationControl(
-                control_id=f"ctrl_{var['name']}",
-                label=var["name"].replace("_", " ").title(),
-                type="slider",
-                affects=[var["name"]],
-                parameters={
-                    "min": var.get("min_value", 0),
-                    "max": var.get("max_value", 100),
-                    "step": var.get("step", 1.0),
-                },
-            )
-            controls.append(control)
-
-        # Create simulation rules
-        rules = [
-            f"{var['name']} affects outcome based on its value" for var in variables[:3]
+        # Variables, controls and the simulation are emitted as dicts in the
+        # WebSimulation shape directly; every value comes from fixed templates
+        variables = [
+            {
+                "name": var_name,
+                "initial_value": initial_value,
+                "min_value": VARIABLE_MIN,
+                "max_value": VARIABLE_MAX,
+                "unit": _UNITS.get(var_name, "units"),
+            }
+            for var_name, initial_value in zip(selected_vars, _INITIAL_VALUES)
         ]
 
-        simulation = WebSimulation(
-            title=f"{topic.title()} Simulation",
-            description=description,
-            variables=variables,
-            controls=controls,
-            rules=rules,
-            visualization_type="chart",
-            metadata={
+        # Create simulation
+        intro_index = self._rng.randrange(len(SIMULATION_INTROS))
+        description = _format_intro(intro_index, topic)
+
+        # Create controls and rules from the precomputed per-variable templates
+        controls = [_control(var_name) for var_name in selected_vars]
+        rules = [_RULES_BY_VARIABLE[var_name] for var_name in selected_vars[:3]]
+
+        # Chart axes follow the first two sampled variables
+        num_selected = len(selected_vars)
+        x_axis = selected_vars[0] if num_selected > 0 else "time"
+        y_axis = selected_vars[1] if num_selected > 1 else "value"
+
+        return {
+            "title": f"{topic.title()} Simulation",
+            "description": description,
+            "variables": variables,
+            "controls": controls,
+            "rules": rules,
+            "visualization_type": "chart",
+            "metadata": {
                 "complexity": complexity,
                 "initial_state": {
-                    var["name"]: var.get(
-                        "initial_value", var.get("default_value", 50.0)
-                    )
-                    for var in variables
-                },
-                "axes": {
-                    "x": selected_vars[0] if len(selected_vars) > 0 else "time",
-                    "y": selected_vars[1] if len(selected_vars) > 1 else "value",
+                    var["name"]: var["initial_value"] for var in variables
                 },
+                "axes": {"x": x_axis, "y": y_axis},
             },
-        )
-
-        return simulation.model_dump()
-
-    def _get_unit(self, variable_name: str) -> str:
-        """Get unit for a variable."""
-        units = {
-            "mass": "kg",
-            "velocity": "m/s",
-            "acceleration": "m/s²",
-            "force": "N",
-            "energy": "J",
-            "temperature": "°C",
-            "pressure": "Pa",
-            "volume": "L",
-            "concentration": "mol/L",
-            "pH": "",
-            "population": "individuals",
-            "growth_rate": "%",
-            "resources": "units",
-            "price": "$",
-            "demand": "units",
-            "supply": "units",
         }
-        return units.get(variable_name, "units")
 
 
 __all__ = ["SimulationDesignerAgent"]
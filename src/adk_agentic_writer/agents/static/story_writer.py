@@ -6,38 +6,34 @@ This agent generates branched narratives using:
 - ContentProtocol: Standard content generation methods
 """
 
+import functools
 import logging
 import random
 from typing import Any, Dict, List, Optional
 
+# Templates are re-exported here for callers that import them from this module
+from ...agents._story_core import (
+    DEFAULT_CHARACTERS,
+    ENDINGS,
+    NODE_CHOICES,
+    PATH_DESCRIPTIONS,
+    STORY_OPENINGS,
+    build_story,
+    pick_opening,
+)
 from ...agents.stateful_agent import StatefulAgent
 from ...models.agent_models import AgentTask, AgentStatus
-from ...models.content_models import BranchedNarrative, StoryNode
+from ...models.content_models import BranchedNarrative
 from ...protocols.content_protocol import ContentBlock, ContentBlockType, ContentPattern
 from ...teams.content_team import STORY_WRITER
 
 logger = logging.getLogger(__name__)
 
-# Story templates
-STORY_OPENINGS = [
-    "You find yourself at the beginning of an extraordinary journey into {topic}.",
-    "As dawn breaks, you stand at the threshold of {topic}.",
-    "A mysterious force draws you toward {topic}.",
-    "The ancient texts spoke of {topic}, but nothing prepared you for this moment.",
-]
-
-PATH_DESCRIPTIONS = {
-    "bold": "Your bold approach to {topic} leads you to unexpected discoveries.",
-    "cautious": "Your careful consideration of {topic} reveals hidden details.",
-    "challenge": "The challenge tests your understanding of {topic}.",
-    "allies": "You find companions who share your interest in {topic}.",
-}
 
-ENDINGS = {
-    "victory": "Through courage and determination, you've mastered {topic}.",
-    "alliance": "Your alliance has transformed the understanding of {topic}.",
-    "wisdom": "The wisdom you've gained about {topic} becomes a beacon for others.",
-}
+@functools.lru_cache(maxsize=256)
+def _slug(topic: str) -> str:
+    """Make a topic safe for use inside a block id."""
+    return topic.replace(" ", "_")
 
 
 class StoryWriterAgent(StatefulAgent):
@@ -54,6 +50,8 @@ class StoryWriterAgent(StatefulAgent):
             agent_id=agent_id,
             config=STORY_WRITER,
         )
+        # Per-agent generator keeps concurrent agents' random state isolated
+        self._rng = random.Random()
         logger.info(f"Initialized StoryWriterAgent {agent_id}")
 
     async def _execute_task(
@@ -78,7 +76,7 @@ class StoryWriterAgent(StatefulAgent):
             return {"blocks": [b.content for b in blocks]}
         else:
             # Default: generate story
-            return await self._generate_story_content(resolved_prompt, context)
+            return self._generate_story_content(resolved_prompt, context)
 
     # ========================================================================
     # ContentProtocol Implementation
@@ -94,10 +92,10 @@ class StoryWriterAgent(StatefulAgent):
         topic = context.get("topic", "adventure")
         genre = context.get("genre", "fantasy")
         
-        story_data = await self._generate_story_data(topic, genre, num_nodes=5)
+        story_data = self._generate_story_data(topic, genre, num_nodes=5)
         
         return ContentBlock(
-            block_id=f"story_{topic.replace(' ', '_')}",
+            block_id="story_" + _slug(topic),
             block_type=block_type,
             content=story_data,
             pattern=ContentPattern.BRANCHED,
@@ -112,10 +110,11 @@ class StoryWriterAgent(StatefulAgent):
         """Generate sequential story chapters."""
         blocks = []
         topic = context.get("topic", "adventure")
+        genre = context.get("genre", "fantasy")
         
         for i in range(num_blocks):
             chapter_topic = f"{topic} - Chapter {i+1}"
-            story_data = await self._generate_story_data(chapter_topic, context.get("genre", "fantasy"), 3)
+            story_data = self._generate_story_data(chapter_topic, genre, 3)
             
             block = ContentBlock(
                 block_id=f"chapter_{i+1}",
@@ -142,9 +141,10 @@ class StoryWriterAgent(StatefulAgent):
         """Generate looped story blocks (e.g., story practice/replay)."""
         blocks = []
         topic = context.get("topic", "adventure")
+        genre = context.get("genre", "fantasy")
         
         for i in range(num_blocks):
-            story_data = await self._generate_story_data(topic, context.get("genre", "fantasy"), 3)
+            story_data = self._generate_story_data(topic, genre, 3)
             
             block = ContentBlock(
                 block_id=f"replay_{i+1}",
@@ -173,22 +173,18 @@ class StoryWriterAgent(StatefulAgent):
         genre = context.get("genre", "fantasy")
         
         # Generate full branched narrative
-        story_data = await self._generate_story_data(topic, genre, num_nodes=7)
+        story_data = self._generate_story_data(topic, genre, num_nodes=7)
         nodes = story_data["nodes"]
         
-        # Convert nodes to content blocks
+        # Convert nodes to content blocks; choices are copied from the
+        # precomputed per-node table so blocks never share them
         for node_id, node in nodes.items():
-            choices = [
-                {"text": branch["text"], "next_block": branch["next_node_id"]}
-                for branch in node.get("branches", [])
-            ]
-            
             block = ContentBlock(
                 block_id=node_id,
                 block_type=ContentBlockType.NODE,
                 content={"text": node["content"], "node": node},
                 pattern=ContentPattern.BRANCHED,
-                choices=choices,
+                choices=[dict(choice) for choice in NODE_CHOICES[node_id]],
             )
             blocks.append(block)
         
@@ -202,10 +198,11 @@ class StoryWriterAgent(StatefulAgent):
         """Generate conditional story blocks."""
         blocks = []
         topic = context.get("topic", "adventure")
+        genre = context.get("genre", "fantasy")
         
         for config in blocks_config:
             condition = config.get("condition", {})
-            story_data = await self._generate_story_data(topic, context.get("genre", "fantasy"), 3)
+            story_data = self._generate_story_data(topic, genre, 3)
             
             block = ContentBlock(
                 block_id=config.get("block_id", f"conditional_{len(blocks)}"),
@@ -222,7 +219,7 @@ class StoryWriterAgent(StatefulAgent):
     # Helper Methods
     # ========================================================================
 
-    async def _generate_story_content(
+    def _generate_story_content(
         self, resolved_prompt: str, context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate story content from resolved prompt."""
@@ -230,112 +227,33 @@ class StoryWriterAgent(StatefulAgent):
         genre = context.get("genre", "fantasy")
         num_nodes = context.get("num_nodes", 7)
         
-        return await self._generate_story_data(topic, genre, num_nodes)
+        return self._generate_story_data(topic, genre, num_nodes)
 
-    async def _generate_story_data(
-        self, topic: str, genre: str, num_nodes: int
+    def _generate_story_data(
+        self, topic: str, genre: str, num_nodes: int, validate: bool = False
     ) -> Dict[str, Any]:
-        """Generate branched narrative story data."""
+        """Generate branched narrative story data.
+
+        Args:
+            topic: Story topic
+            genre: Story genre
+            num_nodes: Node budget; controls which path nodes are included
+            validate: Run the result through BranchedNarrative before
+                returning it
+        """
         logger.info(f"Generating story: {topic}, genre: {genre}, nodes: {num_nodes}")
-        
-        # Generate story nodes
-        nodes = {}
-        
-        # Opening node
-        opening = random.choice(STORY_OPENINGS).format(topic=topic)
-        nodes["start"] = StoryNode(
-            node_id="start",
-            content=opening,
-            branches=[
-                {"text": "Take the bold path", "next_node_id": "bold_path"},
-                {"text": "Proceed with caution", "next_node_id": "cautious_path"},
-            ],
-            tags=["opening", genre],
-            is_ending=False,
-        ).model_dump()
-        
-        # Path nodes
-        if num_nodes >= 3:
-            nodes["bold_path"] = StoryNode(
-                node_id="bold_path",
-                content=PATH_DESCRIPTIONS["bold"].format(topic=topic),
-                branches=[
-                    {"text": "Face the challenge", "next_node_id": "challenge"},
-                    {"text": "Find allies", "next_node_id": "allies"},
-                ],
-                tags=["bold"],
-                is_ending=False,
-            ).model_dump()
-            
-            nodes["cautious_path"] = StoryNode(
-                node_id="cautious_path",
-                content=PATH_DESCRIPTIONS["cautious"].format(topic=topic),
-                branches=[
-                    {"text": "Continue alone", "next_node_id": "challenge"},
-                    {"text": "Seek wisdom", "next_node_id": "wisdom_ending"},
-                ],
-                tags=["cautious"],
-                is_ending=False,
-            ).model_dump()
-        
-        # Intermediate nodes
-        if num_nodes >= 5:
-            nodes["challenge"] = StoryNode(
-                node_id="challenge",
-                content=PATH_DESCRIPTIONS["challenge"].format(topic=topic),
-                branches=[
-                    {"text": "Claim victory", "next_node_id": "victory_ending"},
-                ],
-                tags=["challenge"],
-                is_ending=False,
-            ).model_dump()
-            
-            nodes["allies"] = StoryNode(
-                node_id="allies",
-                content=PATH_DESCRIPTIONS["allies"].format(topic=topic),
-                branches=[
-                    {"text": "Continue together", "next_node_id": "alliance_ending"},
-                ],
-                tags=["allies"],
-                is_ending=False,
-            ).model_dump()
-        
-        # Ending nodes
-        nodes["victory_ending"] = StoryNode(
-            node_id="victory_ending",
-            content=ENDINGS["victory"].format(topic=topic),
-            branches=[],
-            tags=["ending", "victory"],
-            is_ending=True,
-        ).model_dump()
-        
-        nodes["alliance_ending"] = StoryNode(
-            node_id="alliance_ending",
-            content=ENDINGS["alliance"].format(topic=topic),
-            branches=[],
-            tags=["ending", "alliance"],
-            is_ending=True,
-        ).model_dump()
-        
-        nodes["wisdom_ending"] = StoryNode(
-            node_id="wisdom_ending",
-            content=ENDINGS["wisdom"].format(topic=topic),
-            branches=[],
-            tags=["ending", "wisdom"],
-            is_ending=True,
-        ).model_dump()
-        
-        # Create narrative
-        narrative = BranchedNarrative(
-            title=f"The {topic.title()} Chronicles",
-            synopsis=f"An interactive {genre} story about {topic}",
-            genre=genre,
-            start_node="start",
-            nodes=nodes,
-            characters=["Protagonist", "Guide", "Antagonist"],
-        )
-        
-        return narrative.model_dump()
 
+        narrative = build_story(topic, genre, num_nodes, pick_opening(self._rng))
+
+        if validate:
+            return BranchedNarrative(**narrative).model_dump()
+        return narrative
 
-__all__ = ["StoryWriterAgent"]
+
+__all__ = [
+    "DEFAULT_CHARACTERS",
+    "ENDINGS",
+    "PATH_DESCRIPTIONS",
+    "STORY_OPENINGS",
+    "StoryWriterAgent",
+]
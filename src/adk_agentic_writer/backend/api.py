@@ -1,26 +1,32 @@
 """FastAPI backend server for the ADK Agentic Writer system."""
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
 import logging
 import os
-import uuid
+import pathlib
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Sequence, Tuple, cast
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
-
-from ..agents.static import (
-    CoordinatorAgent as StaticCoordinator,
-    StaticQuizWriterAgent,
-    StoryWriterAgent,
-    GameDesignerAgent,
-    SimulationDesignerAgent,
-    ReviewerAgent as StaticReviewer,
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
 )
-from ..models import ContentType
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from .middleware import FastCORS, FastPaths, RequestID
 
 # Load environment variables
 load_dotenv()
@@ -29,33 +35,277 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Gemini agents are optional
+# orjson is optional and only speeds up JSON responses; every use is
+# guarded by _ORJSON_AVAILABLE
 try:
-    from ..agents.gemini import (
-        GeminiCoordinatorAgent,
-        GeminiQuizWriterAgent,
-        GeminiStoryWriterAgent,
-        GeminiGameDesignerAgent,
-        GeminiSimulationDesignerAgent,
-        GeminiReviewerAgent,
-        SupportedTask,
-    )
+    import orjson
 
-    GEMINI_AVAILABLE = True
+    _ORJSON_AVAILABLE = True
 except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Agent packages are imported when a team is first built, keeping module
+# import cheap; Gemini agents additionally need the optional google.adk
+try:
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.adk") is not None
+except ModuleNotFoundError:
     GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     logger.warning("Gemini agents not available (google.adk not installed)")
 
-# Global agent systems - initialize with empty dicts
+# Teams accepted by the generation endpoints
+VALID_TEAMS = frozenset(("static", "gemini"))
+
+# Review criteria used by the review, adaptive and variant workflows
+CRITERIA_FULL = ("clarity", "engagement", "structure", "completeness")
+CRITERIA_QUICK = ("clarity", "engagement")
+CRITERIA_VARIANT = ("clarity", "engagement", "completeness")
+
+# Global agent systems - coordinators are built on first use by get_coordinator
 agent_systems: Dict[str, Any] = {
-    "static": {"initialized": False, "coordinator": None},
-    "gemini": {"initialized": False, "coordinator": None},
+    "static": {"coordinator": None, "lock": asyncio.Lock()},
+    "gemini": {"coordinator": None, "lock": asyncio.Lock()},
 }
 
 
+def _team_available(team: str) -> bool:
+    """Check whether a team can be built, without instantiating it."""
+    if team == "gemini":
+        return GEMINI_AVAILABLE and bool(os.getenv("GOOGLE_API_KEY"))
+    return team == "static"
+
+
+def _new_static_coordinator() -> Any:
+    """Import the static team and construct its coordinator."""
+    from ..agents.static import CoordinatorAgent as StaticCoordinator
+
+    # New coordinator auto-registers agents via runtime
+    return StaticCoordinator(agent_id="static_coordinator")
+
+
+async def _build_coordinator(team: str) -> Any:
+    """Construct the coordinator for a team.
+
+    Agent packages are imported in worker threads so their first import does
+    not stall the event loop.
+    """
+    if team == "static":
+        return await asyncio.to_thread(_new_static_coordinator)
+
+    gemini = await asyncio.to_thread(
+        importlib.import_module, "..agents.gemini", __package__
+    )
+
+    # Gemini agents set up their ADK clients in __init__, so build them in
+    # worker threads concurrently; any failure discards the whole team
+    gemini_coordinator, *gemini_agents = await asyncio.gather(
+        asyncio.to_thread(gemini.GeminiCoordinatorAgent, agent_id="gemini_coordinator"),
+        asyncio.to_thread(gemini.GeminiQuizWriterAgent),
+        asyncio.to_thread(gemini.GeminiStoryWriterAgent),
+        asyncio.to_thread(gemini.GeminiGameDesignerAgent),
+        asyncio.to_thread(gemini.GeminiSimulationDesignerAgent),
+        asyncio.to_thread(gemini.GeminiReviewerAgent),
+    )
+    gemini_coordinator.register_agents(gemini_agents)
+    return gemini_coordinator
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_tasks() -> Tuple[Dict[str, Any], Any]:
+    """Get the content type to Gemini task mapping and its default task."""
+    from ..agents.gemini import SupportedTask
+
+    mapping = {
+        "quiz": SupportedTask.GENERATE_QUIZ,
+        "branched_narrative": SupportedTask.GENERATE_STORY,
+        "quest_game": SupportedTask.GENERATE_GAME,
+        "web_simulation": SupportedTask.GENERATE_SIMULATION,
+    }
+    return mapping, SupportedTask.GENERATE_QUIZ
+
+
+async def get_coordinator(team: str) -> Any:
+    """Get a team's coordinator, building it on first use.
+
+    Construction happens under the team's lock so concurrent first requests
+    share a single coordinator.
+
+    Raises:
+        HTTPException: 503 if the team is unavailable or fails to initialize
+    """
+    system = agent_systems[team]
+    if system["coordinator"] is not None:
+        return system["coordinator"]
+
+    if not _team_available(team):
+        raise HTTPException(
+            status_code=503, detail=f"{team.capitalize()} team not available"
+        )
+
+    async with system["lock"]:
+        if system["coordinator"] is None:
+            try:
+                system["coordinator"] = await _build_coordinator(team)
+                logger.info(f"{team.capitalize()} team initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize {team} team: {e}")
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"{team.capitalize()} team not available",
+                )
+    return system["coordinator"]
+
+
+# Request ids are unique per process: pid and start time plus a counter
+_REQ_COUNTER = itertools.count()
+_REQ_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+
+
+def _next_request_id() -> str:
+    """Return the next request id."""
+    return _REQ_PREFIX + format(next(_REQ_COUNTER), "x")
+
+
+def _request_id(http_request: Request) -> str:
+    """Get the id RequestID assigned to a request, minting one if it is absent."""
+    return http_request.scope.get("state", {}).get("request_id") or _next_request_id()
+
+
+async def _safe(coro: Awaitable[Any]) -> Any:
+    """Await a generation coroutine, returning None if it fails."""
+    try:
+        return await coro
+    except Exception as e:
+        logger.warning(f"Generation task failed: {e}")
+        return None
+
+
+async def _require_static(team: str, feature: str) -> Any:
+    """Get the static coordinator for a static-team-only endpoint.
+
+    Raises:
+        HTTPException: 400 if another team was requested, 503 if the static
+            team is unavailable
+    """
+    if team != "static":
+        raise HTTPException(
+            status_code=400, detail=f"{feature} only available for static team"
+        )
+    return await get_coordinator("static")
+
+
+# Gemini results are cached per (content type, topic, parameters) since each
+# one is a multi-second LLM round trip. Static generation is cheap and
+# randomized, so it is never cached. ADK_RESULT_CACHE_TTL=0 disables caching
+RESULT_CACHE_SIZE = 512
+RESULT_CACHE_TTL = float(os.getenv("ADK_RESULT_CACHE_TTL", "3600"))
+
+# LRU of key -> (expiry on the monotonic clock, JSON-encoded result). Results
+# are stored encoded so no caller can change a cached result in place; every
+# hit decodes a fresh copy
+_result_cache: "OrderedDict[tuple, Tuple[float, bytes]]" = OrderedDict()
+# Per-key (lock, users) so concurrent identical requests share one
+# generation; an entry is dropped when its last user finishes
+_result_locks: Dict[tuple, Tuple[asyncio.Lock, int]] = {}
+
+
+def _params_digest(parameters: Dict[str, Any]) -> bytes:
+    """Hash request parameters independently of their key order."""
+    if not parameters:
+        return b""
+    if _ORJSON_AVAILABLE:
+        encoded = orjson.dumps(
+            parameters, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        encoded = json.dumps(parameters, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _cached_result(key: tuple) -> Optional[Dict[str, Any]]:
+    """Look up an unexpired cached result, returning a fresh copy of it."""
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    result: Dict[str, Any] = _json_loads(entry[1])
+    return result
+
+
+def _store_result(key: tuple, result: Dict[str, Any]) -> None:
+    """Cache a snapshot of a result, evicting the least recently used one when full.
+
+    Results that cannot be encoded as JSON are not cached.
+    """
+    try:
+        encoded = _json_bytes(result)
+    except (TypeError, ValueError):
+        logger.debug("Not caching a result that cannot be encoded as JSON")
+        return
+    if len(_result_cache) >= RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, encoded)
+
+
+async def _run_gemini_task(coordinator: Any, request: "GenerateRequest") -> Dict[str, Any]:
+    """Run a generate request through the Gemini coordinator."""
+    # Gemini team uses structured tasks (old interface for now); its
+    # parameters are built in a single dict display
+    task_mapping, default_task = _gemini_tasks()
+    params = {
+        **request.parameters,
+        "content_type": request.content_type,
+        "topic": request.topic,
+        "task": task_mapping.get(request.content_type, default_task),
+    }
+    result: Dict[str, Any] = await coordinator.process_task(
+        f"Generate {request.content_type}", params
+    )
+    return result
+
+
+async def _generate_gemini(
+    coordinator: Any, request: "GenerateRequest", use_cache: bool
+) -> Dict[str, Any]:
+    """Generate Gemini content, serving repeated requests from the cache.
+
+    Results reporting an error are returned but not cached.
+    """
+    if not use_cache or RESULT_CACHE_TTL <= 0:
+        return await _run_gemini_task(coordinator, request)
+
+    key = (request.content_type, request.topic, _params_digest(request.parameters))
+    result = _cached_result(key)
+    if result is not None:
+        return result
+
+    lock, users = _result_locks.get(key) or (asyncio.Lock(), 0)
+    _result_locks[key] = (lock, users + 1)
+    try:
+        async with lock:
+            result = _cached_result(key)
+            if result is None:
+                result = await _run_gemini_task(coordinator, request)
+                if "error" not in result:
+                    _store_result(key, result)
+    finally:
+        entry = _result_locks.get(key)
+        if entry is not None and entry[0] is lock:
+            if entry[1] > 1:
+                _result_locks[key] = (lock, entry[1] - 1)
+            else:
+                del _result_locks[key]
+    return result
+
+
 class GenerateRequest(BaseModel):
     """Request model for content generation."""
 
+    model_config = ConfigDict(extra="ignore")
+
     team: str = "static"  # "static" or "gemini"
     content_type: str
     topic: str
@@ -72,55 +322,120 @@ class GenerateResponse(BaseModel):
     status: str
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Initialize and cleanup the agent systems."""
-    logger.info("Initializing ADK multi-agent systems...")
+async def _parse_generate_request(http_request: Request) -> GenerateRequest:
+    """Parse a generation request body with pydantic-core's JSON parser.
 
-    # Initialize Static Team
+    Validating the raw bytes skips FastAPI's json.loads pass over bodies
+    with deeply nested parameters.
+    """
     try:
-        # New coordinator auto-registers agents via runtime
-        static_coordinator = StaticCoordinator(agent_id="static_coordinator")
+        return GenerateRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        )
 
-        agent_systems["static"]["coordinator"] = static_coordinator
-        agent_systems["static"]["initialized"] = True
-        logger.info("Static team initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize static team: {e}")
-        agent_systems["static"]["initialized"] = False
 
-    # Initialize Gemini Team (if available)
-    if GEMINI_AVAILABLE:
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if api_key:
-            try:
-                gemini_coordinator = GeminiCoordinatorAgent(
-                    agent_id="gemini_coordinator"
-                )
-                gemini_coordinator.register_agent(GeminiQuizWriterAgent())
-                gemini_coordinator.register_agent(GeminiStoryWriterAgent())
-                gemini_coordinator.register_agent(GeminiGameDesignerAgent())
-                gemini_coordinator.register_agent(GeminiSimulationDesignerAgent())
-                gemini_coordinator.register_agent(GeminiReviewerAgent())
-
-                agent_systems["gemini"]["coordinator"] = gemini_coordinator
-                agent_systems["gemini"]["initialized"] = True
-                logger.info("Gemini team initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize gemini team: {e}")
-                agent_systems["gemini"]["initialized"] = False
-        else:
-            logger.warning("No GOOGLE_API_KEY found - Gemini team unavailable")
-            agent_systems["gemini"]["initialized"] = False
-    else:
+# Bodies are parsed by _parse_generate_request, so document the schema here
+_GENERATE_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": GenerateRequest.model_json_schema()}
+        },
+    }
+}
+
+# Documents the response shape without validating responses at runtime
+_GENERATE_RESPONSES: Dict[int | str, Dict[str, Any]] = {200: {"model": GenerateResponse}}
+
+
+def _json_bytes(content: Any) -> bytes:
+    """Encode content as compact JSON bytes."""
+    if _ORJSON_AVAILABLE:
+        return cast(bytes, orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS))
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return _json_bytes(content)
+
+
+# Response class for JSON endpoints; falls back to the stdlib encoder
+JSON_RESPONSE_CLASS = ORJSONResponse if _ORJSON_AVAILABLE else JSONResponse
+
+
+def _generate_response(
+    request_id: str,
+    team: str,
+    content_type: str,
+    content: Dict[str, Any],
+    status: str,
+) -> Response:
+    """Build a generation response shaped like GenerateResponse.
+
+    The dict is encoded directly rather than validated through the model
+    first; routes reference GenerateResponse only for the OpenAPI schema.
+    """
+    return JSON_RESPONSE_CLASS(
+        content={
+            "request_id": request_id,
+            "team": team,
+            "content_type": content_type,
+            "content": content,
+            "status": status,
+        }
+    )
+
+
+async def _warm_team(team: str) -> None:
+    """Build a team's coordinator ahead of its first request."""
+    start = time.perf_counter()
+    try:
+        await get_coordinator(team)
+    except HTTPException:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"{team.capitalize()} team warmed up in {elapsed_ms:.1f}ms")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Report team availability and release the agent systems on shutdown."""
+    if not GEMINI_AVAILABLE:
         logger.warning("Gemini agents not available (google.adk package not installed)")
-        agent_systems["gemini"]["initialized"] = False
+    elif not os.getenv("GOOGLE_API_KEY"):
+        logger.warning("No GOOGLE_API_KEY found - Gemini team unavailable")
+
+    # Teams are otherwise built on first use; ADK_WARM_TEAMS builds every
+    # available team at startup, concurrently
+    if os.getenv("ADK_WARM_TEAMS"):
+        await asyncio.gather(
+            *(_warm_team(team) for team in sorted(VALID_TEAMS) if _team_available(team))
+        )
 
     yield
 
     # Shutdown
     logger.info("Shutting down ADK multi-agent systems...")
-    agent_systems.clear()
+    for system in agent_systems.values():
+        system["coordinator"] = None
+        system["lock"] = asyncio.Lock()
+    _result_cache.clear()
+    _result_locks.clear()
 
 
 # Create FastAPI app
@@ -129,34 +444,51 @@ app = FastAPI(
     description="Multi-agentic system for interactive content production",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=JSON_RESPONSE_CLASS,
 )
 
-# Add CORS middleware
+# Add CORS middleware; ADK_CORS_ORIGINS is a comma-separated origin list
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "ADK_CORS_ORIGINS", "http://localhost:3000,http://localhost:8000"
+    ).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure for production
+    FastCORS,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
+# Frontend pages are small, so they are read into memory once at import
+# together with a content-hash ETag, and requests never touch the disk. Set
+# ADK_DEV_RELOAD to re-read them on every request while editing the frontend
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
+PUBLIC_DIR = PROJECT_ROOT / "frontend" / "public"
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the server directory page."""
-    import pathlib
 
-    # Get the path to the frontend/public/index.html
-    current_file = pathlib.Path(__file__)
-    project_root = current_file.parent.parent.parent.parent
-    index_path = project_root / "frontend" / "public" / "index.html"
+def _load_page(name: str) -> Optional[Tuple[bytes, str]]:
+    """Read a frontend page and its ETag, or None if it does not exist."""
+    try:
+        content = (PUBLIC_DIR / name).read_bytes()
+    except FileNotFoundError:
+        return None
+    return content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
 
-    if index_path.exists():
-        return index_path.read_text(encoding="utf-8")
-    else:
-        # Fallback to JSON response if file not found
-        return HTMLResponse(
-            content="""
+
+_PAGES = {
+    name: _load_page(name)
+    for name in ("index.html", "showcase.html", "frontend.html")
+}
+
+if PUBLIC_DIR.is_dir():
+    app.mount("/static", StaticFiles(directory=PUBLIC_DIR), name="static")
+
+_FALLBACK_INDEX = b"""
             <html>
                 <head><title>ADK Agentic Writer</title></head>
                 <body>
@@ -169,86 +501,197 @@ async def root():
                     </ul>
                 </body>
             </html>
-            """,
-            status_code=200,
-        )
+            """
+_FALLBACK_SHOWCASE = b"<html><body><h1>Showcase page not found</h1></body></html>"
+_FALLBACK_FRONTEND = b"<html><body><h1>Frontend page not found</h1></body></html>"
 
 
-@app.get("/api")
-async def api_info():
-    """API information endpoint."""
-    return {
-        "message": "ADK Agentic Writer API",
-        "version": "1.0.0",
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an ETag against an If-None-Match header using weak comparison."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _page_response(
+    request: Request, name: str, fallback: bytes, missing_status: int
+) -> Response:
+    """Serve a frontend page, answering 304 when the client copy is current."""
+    page = _load_page(name) if os.getenv("ADK_DEV_RELOAD") else _PAGES[name]
+    if page is None:
+        return HTMLResponse(content=fallback, status_code=missing_status)
+
+    content, etag = page
+    headers = {"etag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    """Serve the server directory page."""
+    return _page_response(request, "index.html", _FALLBACK_INDEX, 200)
+
+
+# Status payloads only depend on team availability, so they are encoded once
+# per availability state and the bytes are shared between requests
+_CONTENT_TYPES_PAYLOAD = {
+    "content_types": [
+        {
+            "value": "quiz",
+            "label": "Quiz",
+            "description": "Interactive quizzes with multiple choice questions",
+        },
+        {
+            "value": "quest_game",
+            "label": "Quest Game",
+            "description": "Quest-based adventure games with choices and rewards",
+        },
+        {
+            "value": "branched_narrative",
+            "label": "Branched Story",
+            "description": "Branching storylines with multiple endings",
+        },
+        {
+            "value": "web_simulation",
+            "label": "Simulation",
+            "description": "Interactive simulations with variables and controls",
+        },
+    ]
+}
+
+_STATIC_TEAM_INFO = {
+    "id": "static",
+    "name": "Static Team",
+    "description": "Fast, template-based generation. No API calls required.",
+    "available": False,
+    "icon": "⚡",
+}
+_GEMINI_TEAM_INFO = {
+    "id": "gemini",
+    "name": "Gemini Team",
+    "description": "AI-powered generation via Google ADK. High quality, creative.",
+    "available": False,
+    "icon": "🤖",
+}
+
+
+_CONTENT_TYPES_JSON = _json_bytes(_CONTENT_TYPES_PAYLOAD)
+
+
+@functools.lru_cache(maxsize=2)
+def _status_payloads(gemini_available: bool) -> Dict[str, bytes]:
+    """Build the encoded /api, /health and /teams payloads."""
+    static_available = _team_available("static")
+    payloads = {
+        "api": {
+            "message": "ADK Agentic Writer API",
+            "version": "1.0.0",
+            "teams": {"static": static_available, "gemini": gemini_available},
+        },
+        "health": {
+            "status": "healthy",
+            "static_team": static_available,
+            "gemini_team": gemini_available,
+        },
         "teams": {
-            "static": agent_systems["static"].get("initialized", False),
-            "gemini": agent_systems["gemini"].get("initialized", False),
+            "teams": [
+                {**_STATIC_TEAM_INFO, "available": static_available},
+                {**_GEMINI_TEAM_INFO, "available": gemini_available},
+            ]
         },
     }
+    return {name: _json_bytes(payload) for name, payload in payloads.items()}
+
+
+def _status_body(name: str) -> bytes:
+    """Get one of the cached status payloads for the current availability."""
+    return _status_payloads(_team_available("gemini"))[name]
+
+
+def _status_response(name: str) -> Response:
+    """Serve one of the cached status payloads."""
+    return Response(content=_status_body(name), media_type="application/json")
+
+
+# Probes and other Origin-less status requests are answered ahead of the
+# middleware stack and router; the routes below still serve browsers and
+# document the endpoints
+app.add_middleware(
+    FastPaths,
+    routes={
+        path: functools.partial(_status_body, name)
+        for path, name in (("/api", "api"), ("/health", "health"), ("/teams", "teams"))
+    },
+)
+
+# Request ids are assigned once per request and echoed as X-Request-ID; the
+# generate endpoints report the same id in their response body. Added last so
+# it wraps FastPaths and fast-path responses carry the header too
+app.add_middleware(RequestID, id_factory=_next_request_id)
+
+
+@app.get("/api")
+async def api_info():
+    """API information endpoint."""
+    return _status_response("api")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "static_team": agent_systems["static"].get("initialized", False),
-        "gemini_team": agent_systems["gemini"].get("initialized", False),
-    }
+    return _status_response("health")
+
+
+@app.delete("/cache")
+async def clear_cache() -> Dict[str, int]:
+    """Drop all cached Gemini results."""
+    cleared = len(_result_cache)
+    _result_cache.clear()
+    return {"cleared": cleared}
+
 
+@app.post(
+    "/generate",
+    responses=_GENERATE_RESPONSES,
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
+)
+async def generate_content(
+    http_request: Request,
+    request: GenerateRequest = Depends(_parse_generate_request),
+    no_cache: bool = False,
+):
+    """Generate content using specified team.
 
-@app.post("/generate", response_model=GenerateResponse)
-async def generate_content(request: GenerateRequest):
-    """Generate content using specified team."""
-    request_id = str(uuid.uuid4())
+    Gemini results are cached; pass ``no_cache=true`` to bypass the cache.
+    """
+    request_id = _request_id(http_request)
 
     # Validate team
-    if request.team not in ["static", "gemini"]:
+    if request.team not in VALID_TEAMS:
         raise HTTPException(status_code=400, detail=f"Invalid team: {request.team}")
 
-    # Check if team is initialized
-    if not agent_systems[request.team].get("initialized"):
-        raise HTTPException(
-            status_code=503, detail=f"{request.team.capitalize()} team not available"
-        )
-
-    # Get coordinator
-    coordinator = agent_systems[request.team]["coordinator"]
+    # Get coordinator, building the team on first use
+    coordinator = await get_coordinator(request.team)
 
     try:
-        # Prepare parameters
-        params = request.parameters.copy() if request.parameters else {}
-        topic = request.topic
-
-        # Generate content based on team and content type
+        # Generate content based on team and content type. Keyword unpacking
+        # already builds a fresh dict, so the parameters are not copied first
         if request.team == "static":
             # Static team uses generate_content method
             result = await coordinator.generate_content(
-                content_type=request.content_type, topic=topic, **params
+                content_type=request.content_type,
+                topic=request.topic,
+                **request.parameters,
             )
         else:
-            # Gemini team uses structured tasks (old interface for now)
-            params["content_type"] = request.content_type
-            params["topic"] = topic
-
-            if GEMINI_AVAILABLE and SupportedTask:
-                task_mapping = {
-                    "quiz": SupportedTask.GENERATE_QUIZ,
-                    "branched_narrative": SupportedTask.GENERATE_STORY,
-                    "quest_game": SupportedTask.GENERATE_GAME,
-                    "web_simulation": SupportedTask.GENERATE_SIMULATION,
-                }
-                task = task_mapping.get(
-                    request.content_type, SupportedTask.GENERATE_QUIZ
-                )
-                params["task"] = task
+            result = await _generate_gemini(coordinator, request, not no_cache)
 
-            # Note: Gemini coordinator still uses old interface
-            result = await coordinator.process_task(
-                f"Generate {request.content_type}", params
-            )
-
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type=request.content_type,
@@ -259,7 +702,7 @@ async def generate_content(request: GenerateRequest):
     except ValueError as e:
         # Handle invalid content types gracefully
         logger.warning(f"Invalid content type or parameters: {e}")
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type=request.content_type,
@@ -271,20 +714,19 @@ async def generate_content(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/generate/with-review", response_model=GenerateResponse)
-async def generate_with_review(request: GenerateRequest):
+@app.post(
+    "/generate/with-review",
+    responses=_GENERATE_RESPONSES,
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
+)
+async def generate_with_review(
+    http_request: Request,
+    request: GenerateRequest = Depends(_parse_generate_request),
+):
     """Generate content with review and refinement cycles."""
-    request_id = str(uuid.uuid4())
-
-    if request.team != "static":
-        raise HTTPException(
-            status_code=400, detail="Review workflow only available for static team"
-        )
-
-    if not agent_systems["static"].get("initialized"):
-        raise HTTPException(status_code=503, detail="Static team not available")
+    request_id = _request_id(http_request)
 
-    coordinator = agent_systems["static"]["coordinator"]
+    coordinator = await _require_static(request.team, "Review workflow")
 
     try:
         params = request.parameters.copy() if request.parameters else {}
@@ -300,13 +742,9 @@ async def generate_with_review(request: GenerateRequest):
         review_history = []
 
         for iteration in range(max_iterations):
-            review = await reviewer.process_task(
-                None,
-                {
-                    "content": result["content"],
-                    "content_type": request.content_type,
-                    "criteria": ["clarity", "engagement", "structure", "completeness"],
-                },
+            review = await reviewer.review_content(
+                result["content"],
+                {"content_type": request.content_type, "criteria": CRITERIA_FULL},
             )
             review_history.append(review)
 
@@ -323,7 +761,7 @@ async def generate_with_review(request: GenerateRequest):
             "iterations": len(review_history),
         }
 
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type=request.content_type,
@@ -336,21 +774,95 @@ async def generate_with_review(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/generate/multimodal-story")
-async def generate_multimodal_story(request: GenerateRequest):
-    """Generate complex multimodal story with embedded games and quizzes."""
-    request_id = str(uuid.uuid4())
+async def _tagged(kind: str, index: int, coro: Awaitable[Any]) -> tuple:
+    """Await a coroutine and label its result with its kind and index."""
+    return kind, index, await coro
+
+
+async def _stream_multimodal_story(
+    request_id: str,
+    story_coro: Awaitable[Any],
+    game_coros: Sequence[Awaitable[Any]],
+    quiz_coros: Sequence[Awaitable[Any]],
+) -> StreamingResponse:
+    """Stream a multimodal story, sending embedded content as it completes.
+
+    The story is awaited before the response starts so a failed story still
+    ends in an error status. Games and quizzes keep generating meanwhile.
+    Unlike the buffered response, they are not injected into story nodes:
+    the content carries an "embedded" list of {"type", "index", "data"}
+    entries in completion order, followed by the same embedded_games,
+    embedded_quizzes and total_nodes counts. Generation still pending when
+    the client disconnects is cancelled.
+    """
+    pending = [
+        asyncio.ensure_future(_tagged("game", i, coro))
+        for i, coro in enumerate(game_coros)
+    ] + [
+        asyncio.ensure_future(_tagged("quiz", i, coro))
+        for i, coro in enumerate(quiz_coros)
+    ]
+
+    story_result = await story_coro
+    if not story_result:
+        for task in pending:
+            task.cancel()
+        raise ValueError("Story generation failed")
+
+    story_content = story_result["content"]
+    total_nodes = len(story_content.get("nodes", {}))
+
+    async def body() -> AsyncIterator[bytes]:
+        counts = {"game": 0, "quiz": 0}
+        try:
+            yield (
+                b'{"request_id":'
+                + _json_bytes(request_id)
+                + b',"team":"static","content_type":"multimodal_story",'
+                b'"content":{"content_type":"multimodal_story","content":'
+                + _json_bytes(story_content)
+                + b',"embedded":['
+            )
+            separator = b""
+            for next_done in asyncio.as_completed(pending):
+                kind, index, result = await next_done
+                if result is None:
+                    continue
+                counts[kind] += 1
+                yield separator + _json_bytes(
+                    {"type": kind, "index": index, "data": result["content"]}
+                )
+                separator = b","
+            yield (
+                b'],"embedded_games":%d,"embedded_quizzes":%d,"total_nodes":%d,'
+                b'"generation_method":"streamed_mixed_team"},"status":"completed"}'
+                % (counts["game"], counts["quiz"], total_nodes)
+            )
+        finally:
+            for task in pending:
+                task.cancel()
 
-    if request.team != "static":
-        raise HTTPException(
-            status_code=400,
-            detail="Multimodal stories only available for static team",
-        )
+    return StreamingResponse(body(), media_type="application/json")
+
+
+@app.post(
+    "/generate/multimodal-story",
+    responses=_GENERATE_RESPONSES,
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
+)
+async def generate_multimodal_story(
+    http_request: Request,
+    request: GenerateRequest = Depends(_parse_generate_request),
+):
+    """Generate complex multimodal story with embedded games and quizzes.
 
-    if not agent_systems["static"].get("initialized"):
-        raise HTTPException(status_code=503, detail="Static team not available")
+    With ``"stream": true`` in the parameters the response is streamed, and
+    games and quizzes arrive in an "embedded" list rather than inside the
+    story nodes (see _stream_multimodal_story).
+    """
+    request_id = _request_id(http_request)
 
-    coordinator = agent_systems["static"]["coordinator"]
+    coordinator = await _require_static(request.team, "Multimodal stories")
 
     try:
         params = request.parameters.copy() if request.parameters else {}
@@ -359,67 +871,76 @@ async def generate_multimodal_story(request: GenerateRequest):
         num_mini_quizzes = params.get("num_mini_quizzes", 2)
         genre = params.get("genre", "adventure")
 
-        # Parallel generation
-        results = await asyncio.gather(
+        # Parallel generation; failed tasks come back as None
+        story_coro = _safe(
             coordinator.generate_content(
                 "branched_narrative",
                 request.topic,
                 num_nodes=num_story_nodes,
                 genre=genre,
-            ),
-            *[
+            )
+        )
+        game_coros = [
+            _safe(
                 coordinator.generate_content(
                     "quest_game", f"{request.topic} Mini-Game {i+1}", num_nodes=4
                 )
-                for i in range(num_mini_games)
-            ],
-            *[
+            )
+            for i in range(num_mini_games)
+        ]
+        quiz_coros = [
+            _safe(
                 coordinator.generate_content(
                     "quiz", f"{request.topic} Quiz {i+1}", num_questions=3
                 )
-                for i in range(num_mini_quizzes)
-            ],
-            return_exceptions=True,
-        )
+            )
+            for i in range(num_mini_quizzes)
+        ]
+
+        if params.get("stream"):
+            return await _stream_multimodal_story(
+                request_id, story_coro, game_coros, quiz_coros
+            )
+
+        results = await asyncio.gather(story_coro, *game_coros, *quiz_coros)
 
         # Extract and integrate
-        story_result = results[0] if not isinstance(results[0], Exception) else None
+        story_result = results[0]
         if not story_result:
             raise ValueError("Story generation failed")
 
         story_content = story_result["content"]
         nodes = story_content.get("nodes", {})
+        node_ids = list(nodes)
+        n_nodes = len(node_ids)
 
         # Inject games and quizzes
         game_results = results[1 : 1 + num_mini_games]
         quiz_results = results[1 + num_mini_games :]
 
         for i, result in enumerate(game_results):
-            if not isinstance(result, Exception) and i + 1 < len(nodes):
-                node_id = list(nodes.keys())[i + 1]
-                nodes[node_id]["embedded_game"] = result["content"]
+            idx = i + 1
+            if idx < n_nodes and result is not None:
+                nodes[node_ids[idx]]["embedded_game"] = result["content"]
 
         for i, result in enumerate(quiz_results):
-            if not isinstance(result, Exception) and num_mini_games + i + 1 < len(
-                nodes
-            ):
-                node_id = list(nodes.keys())[num_mini_games + i + 1]
-                nodes[node_id]["embedded_quiz"] = result["content"]
+            idx = num_mini_games + i + 1
+            if idx < n_nodes and result is not None:
+                nodes[node_ids[idx]]["embedded_quiz"] = result["content"]
+
+        games_ok = [r for r in game_results if r is not None]
+        quizzes_ok = [r for r in quiz_results if r is not None]
 
         multimodal_result = {
             "content_type": "multimodal_story",
             "content": story_content,
-            "embedded_games": sum(
-                1 for r in game_results if not isinstance(r, Exception)
-            ),
-            "embedded_quizzes": sum(
-                1 for r in quiz_results if not isinstance(r, Exception)
-            ),
-            "total_nodes": len(nodes),
+            "embedded_games": len(games_ok),
+            "embedded_quizzes": len(quizzes_ok),
+            "total_nodes": n_nodes,
             "generation_method": "parallel_mixed_team",
         }
 
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type="multimodal_story",
@@ -432,20 +953,19 @@ async def generate_multimodal_story(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/generate/adaptive")
-async def generate_adaptive(request: GenerateRequest):
+@app.post(
+    "/generate/adaptive",
+    responses=_GENERATE_RESPONSES,
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
+)
+async def generate_adaptive(
+    http_request: Request,
+    request: GenerateRequest = Depends(_parse_generate_request),
+):
     """Generate content with adaptive workflow based on quality metrics."""
-    request_id = str(uuid.uuid4())
-
-    if request.team != "static":
-        raise HTTPException(
-            status_code=400, detail="Adaptive workflow only available for static team"
-        )
+    request_id = _request_id(http_request)
 
-    if not agent_systems["static"].get("initialized"):
-        raise HTTPException(status_code=503, detail="Static team not available")
-
-    coordinator = agent_systems["static"]["coordinator"]
+    coordinator = await _require_static(request.team, "Adaptive workflow")
 
     try:
         params = request.parameters.copy() if request.parameters else {}
@@ -458,13 +978,9 @@ async def generate_adaptive(request: GenerateRequest):
 
         # Quick review
         reviewer = coordinator._get_reviewer()
-        review = await reviewer.process_task(
-            None,
-            {
-                "content": result["content"],
-                "content_type": request.content_type,
-                "criteria": ["clarity", "engagement"],
-            },
+        review = await reviewer.review_content(
+            result["content"],
+            {"content_type": request.content_type, "criteria": CRITERIA_QUICK},
         )
 
         # Adaptive branching
@@ -486,7 +1002,7 @@ async def generate_adaptive(request: GenerateRequest):
             "adaptive": True,
         }
 
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type=request.content_type,
@@ -499,57 +1015,55 @@ async def generate_adaptive(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/generate/parallel-variants")
-async def generate_parallel_variants(request: GenerateRequest):
+@app.post(
+    "/generate/parallel-variants",
+    responses=_GENERATE_RESPONSES,
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
+)
+async def generate_parallel_variants(
+    http_request: Request,
+    request: GenerateRequest = Depends(_parse_generate_request),
+):
     """Generate multiple variants in parallel and select the best."""
-    request_id = str(uuid.uuid4())
+    request_id = _request_id(http_request)
 
-    if request.team != "static":
-        raise HTTPException(
-            status_code=400,
-            detail="Parallel variants only available for static team",
-        )
-
-    if not agent_systems["static"].get("initialized"):
-        raise HTTPException(status_code=503, detail="Static team not available")
-
-    coordinator = agent_systems["static"]["coordinator"]
+    coordinator = await _require_static(request.team, "Parallel variants")
 
     try:
         params = request.parameters.copy() if request.parameters else {}
         num_variants = params.pop("num_variants", 3)
         params.pop("merge_best", True)  # Remove unused parameter
 
-        # Generate variants in parallel
+        # Generate variants in parallel; failed variants come back as None
         variants = await asyncio.gather(
             *[
-                coordinator.generate_content(
-                    request.content_type, request.topic, **params
+                _safe(
+                    coordinator.generate_content(
+                        request.content_type, request.topic, **params
+                    )
                 )
                 for _ in range(num_variants)
-            ],
-            return_exceptions=True,
+            ]
         )
 
-        valid_variants = [v for v in variants if not isinstance(v, Exception)]
+        valid_variants = [v for v in variants if v is not None]
         if not valid_variants:
             raise ValueError("No valid variants generated")
 
-        # Review all variants
+        # Review all variants in one batch; reviewers without a batch API
+        # fall back to one review per variant
         reviewer = coordinator._get_reviewer()
-        reviews = await asyncio.gather(
-            *[
-                reviewer.process_task(
-                    None,
-                    {
-                        "content": v["content"],
-                        "content_type": request.content_type,
-                        "criteria": ["clarity", "engagement", "completeness"],
-                    },
-                )
-                for v in valid_variants
-            ]
-        )
+        review_criteria = {
+            "content_type": request.content_type,
+            "criteria": CRITERIA_VARIANT,
+        }
+        contents = [v["content"] for v in valid_variants]
+        if hasattr(reviewer, "review_batch"):
+            reviews = await reviewer.review_batch(contents, review_criteria)
+        else:
+            reviews = await asyncio.gather(
+                *[reviewer.review_content(c, review_criteria) for c in contents]
+            )
 
         # Select best variant
         best_idx = max(enumerate(reviews), key=lambda x: x[1]["overall_score"])[0]
@@ -563,7 +1077,7 @@ async def generate_parallel_variants(request: GenerateRequest):
             "generation_method": "parallel_selection",
         }
 
-        return GenerateResponse(
+        return _generate_response(
             request_id=request_id,
             team=request.team,
             content_type=request.content_type,
@@ -577,95 +1091,43 @@ async def generate_parallel_variants(request: GenerateRequest):
 
 
 @app.get("/showcase", response_class=HTMLResponse)
-async def showcase():
+async def showcase(request: Request):
     """Serve the showcase page."""
-    import pathlib
-
-    # Get the path to the frontend/public/showcase.html
-    current_file = pathlib.Path(__file__)
-    project_root = current_file.parent.parent.parent.parent
-    showcase_path = project_root / "frontend" / "public" / "showcase.html"
-
-    if showcase_path.exists():
-        return showcase_path.read_text(encoding="utf-8")
-    else:
-        return HTMLResponse(
-            content="<html><body><h1>Showcase page not found</h1></body></html>",
-            status_code=404,
-        )
+    return _page_response(request, "showcase.html", _FALLBACK_SHOWCASE, 404)
 
 
 @app.get("/frontend", response_class=HTMLResponse)
-async def frontend():
+async def frontend(request: Request):
     """Serve the legacy frontend page."""
-    import pathlib
-
-    current_file = pathlib.Path(__file__)
-    project_root = current_file.parent.parent.parent.parent
-    frontend_path = project_root / "frontend" / "public" / "frontend.html"
-
-    if frontend_path.exists():
-        return frontend_path.read_text(encoding="utf-8")
-    else:
-        return HTMLResponse(
-            content="<html><body><h1>Frontend page not found</h1></body></html>",
-            status_code=404,
-        )
+    return _page_response(request, "frontend.html", _FALLBACK_FRONTEND, 404)
 
 
 @app.get("/teams")
 async def get_teams():
     """Get available teams and their status."""
-    return {
-        "teams": [
-            {
-                "id": "static",
-                "name": "Static Team",
-                "description": "Fast, template-based generation. No API calls required.",
-                "available": agent_systems["static"].get("initialized", False),
-                "icon": "⚡",
-            },
-            {
-                "id": "gemini",
-                "name": "Gemini Team",
-                "description": "AI-powered generation via Google ADK. High quality, creative.",
-                "available": agent_systems["gemini"].get("initialized", False),
-                "icon": "🤖",
-            },
-        ]
-    }
+    return _status_response("teams")
 
 
 @app.get("/content-types")
 async def get_content_types():
     """Get available content types."""
-    return {
-        "content_types": [
-            {
-                "value": "quiz",
-                "label": "Quiz",
-                "description": "Interactive quizzes with multiple choice questions",
-            },
-            {
-                "value": "quest_game",
-                "label": "Quest Game",
-                "description": "Quest-based adventure games with choices and rewards",
-            },
-            {
-                "value": "branched_narrative",
-                "label": "Branched Story",
-                "description": "Branching storylines with multiple endings",
-            },
-            {
-                "value": "web_simulation",
-                "label": "Simulation",
-                "description": "Interactive simulations with variables and controls",
-            },
-        ]
-    }
+    return Response(content=_CONTENT_TYPES_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]; fall back without them.
+    # Multiple workers need the app as an import string. ADK_ACCESS_LOG=0
+    # drops the per-request access log line, which otherwise costs a
+    # formatted write to stdout per request
+    workers = int(os.getenv("ADK_WORKERS", "1"))
+    uvicorn.run(
+        f"{__spec__.name}:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=workers,
+        access_log=os.getenv("ADK_ACCESS_LOG", "1") != "0",
+    )
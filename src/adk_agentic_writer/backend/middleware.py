@@ -0,0 +1,232 @@
+"""Pure ASGI middleware for the backend API."""
+
+import os
+import re
+from typing import Callable, Iterable, List, Mapping, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request headers browsers may send without listing them in a preflight
+SAFELISTED_HEADERS = frozenset(
+    (b"accept", b"accept-language", b"content-language", b"content-type")
+)
+
+
+class FastCORS:
+    """CORS middleware with its response headers encoded once at startup.
+
+    Preflight requests are answered here without reaching the app; other
+    requests from allowed origins get the CORS headers appended to their
+    response start message.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = (),
+        allow_methods: Iterable[str] = ("GET", "POST"),
+        allow_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            allow_origins: Allowed origins; "*" allows any origin
+            allow_methods: Methods allowed in cross-origin requests
+            allow_headers: Request headers allowed besides safelisted ones
+            allow_credentials: Whether to allow credentialed requests
+            max_age: Seconds browsers may cache a preflight response
+        """
+        self.app = app
+        origins = tuple(allow_origins)
+        methods = tuple(method.upper() for method in allow_methods)
+        headers = tuple(allow_headers)
+
+        self._allow_any_origin = "*" in origins
+        self._origins = frozenset(origin.encode("latin-1") for origin in origins)
+        self._methods = frozenset(method.encode("latin-1") for method in methods)
+        self._headers = SAFELISTED_HEADERS | frozenset(
+            header.lower().encode("latin-1") for header in headers
+        )
+
+        common: List[Tuple[bytes, bytes]] = [(b"vary", b"Origin")]
+        if allow_credentials:
+            common.append((b"access-control-allow-credentials", b"true"))
+        self._simple_headers = common
+        self._preflight_headers = common + [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-allow-headers", b", ".join(sorted(self._headers))),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+
+    def _origin_allowed(self, origin: bytes) -> bool:
+        """Check an Origin header value against the allow-list."""
+        return self._allow_any_origin or origin in self._origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        if not self._origin_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), *self._simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        """Answer a preflight request directly."""
+        allowed = self._origin_allowed(origin) and request_method in self._methods
+        if allowed and request_headers:
+            allowed = all(
+                header.strip().lower() in self._headers
+                for header in request_headers.split(b",")
+                if header.strip()
+            )
+
+        if allowed:
+            status = 200
+            headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        else:
+            status = 400
+            headers = [(b"vary", b"Origin"), (b"content-length", b"0")]
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+# Upstream request ids are reused only if they are short plain tokens
+_REQUEST_ID_PATTERN = re.compile(rb"[A-Za-z0-9._:-]{1,128}")
+
+
+class RequestID:
+    """Assign each HTTP request an id and echo it in an X-Request-ID header.
+
+    An X-Request-ID sent by the client or a proxy is reused when it is a short
+    plain token; otherwise a new id is minted. The id is stored in
+    ``scope["state"]["request_id"]`` so handlers can read it from
+    ``request.state.request_id``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        id_factory: Callable[[], str] = lambda: os.urandom(8).hex(),
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            id_factory: Callable minting ids for requests that lack one
+        """
+        self.app = app
+        self._id_factory = id_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                header = value
+                break
+
+        if header is not None and _REQUEST_ID_PATTERN.fullmatch(header):
+            request_id = header.decode("ascii")
+        else:
+            request_id = self._id_factory()
+            header = request_id.encode("latin-1")
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (b"x-request-id", header)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_id)
+
+
+class FastPaths:
+    """Answer GET requests for fixed paths before they reach the app.
+
+    Meant for status routes polled by probes: a matching request without an
+    Origin header gets the bytes from the path's callable directly, skipping
+    the inner middleware, routing and dependency resolution. Requests that
+    carry an Origin header pass through so they still get CORS handling.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Mapping[str, Callable[[], bytes]],
+        media_type: str = "application/json",
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            routes: Path to a callable returning the response body
+            media_type: Content type of every fast path response
+        """
+        self.app = app
+        self._routes = dict(routes)
+        self._content_type = media_type.encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        body_factory = None
+        if scope["type"] == "http" and scope["method"] == "GET":
+            body_factory = self._routes.get(scope["path"])
+        if body_factory is None or any(
+            name == b"origin" for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = body_factory()
+        headers = [
+            (b"content-type", self._content_type),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+__all__ = ["FastCORS", "FastPaths", "RequestID"]
@@ -1,73 +1,58 @@
 """Models package initialization."""
 
-from .agent_models import (
-    AgentConfig,
-    AgentMessage,
-    AgentModel,
-    AgentRole,
-    AgentState,
-    AgentStatus,
-    AgentTask,
-    AgentToolModel,
-    FunctionToolModel,
-    TeamMetadata,
-    WorkflowDecision,
-    WorkflowMetadata,
-    WorkflowPattern,
-    WorkflowScope,
-)
-from .content_models import (
-    BranchedNarrative,
-    ContentType,
-    QuestGame,
-    Quiz,
-    WebSimulation,
-)
-from .editorial_models import (
-    ContentRevision,
-    EditorialAction,
-    EditorialRequest,
-    EditorialResponse,
-    EditorialWorkflow,
-    Feedback,
-    FeedbackType,
-    QualityMetrics,
-    RefinementContext,
-    ValidationResult,
-)
+import importlib
+from typing import Any, List
 
-__all__ = [
+# Models are imported on first access (PEP 562), so importing one model
+# module does not build the pydantic classes of the others
+_LAZY_IMPORTS = {
     # Agent models
-    "AgentMessage",
-    "AgentRole",
-    "AgentState",
-    "AgentStatus",
-    "AgentTask",
-    "AgentConfig",
-    "AgentModel",
-    "AgentToolModel",
-    "FunctionToolModel",
+    "AgentMessage": ".agent_models",
+    "AgentRole": ".agent_models",
+    "AgentState": ".agent_models",
+    "AgentStatus": ".agent_models",
+    "AgentTask": ".agent_models",
+    "AgentConfig": ".agent_models",
+    "AgentModel": ".agent_models",
+    "AgentToolModel": ".agent_models",
+    "FunctionToolModel": ".agent_models",
     # Workflow and team models
-    "TeamMetadata",
-    "WorkflowMetadata",
-    "WorkflowPattern",
-    "WorkflowScope",
-    "WorkflowDecision",
+    "TeamMetadata": ".agent_models",
+    "WorkflowMetadata": ".agent_models",
+    "WorkflowPattern": ".agent_models",
+    "WorkflowScope": ".agent_models",
+    "WorkflowDecision": ".agent_models",
     # Content models
-    "BranchedNarrative",
-    "ContentType",
-    "QuestGame",
-    "Quiz",
-    "WebSimulation",
+    "BranchedNarrative": ".content_models",
+    "ContentType": ".content_models",
+    "QuestGame": ".content_models",
+    "Quiz": ".content_models",
+    "WebSimulation": ".content_models",
     # Editorial models
-    "ContentRevision",
-    "EditorialAction",
-    "EditorialRequest",
-    "EditorialResponse",
-    "EditorialWorkflow",
-    "Feedback",
-    "FeedbackType",
-    "QualityMetrics",
-    "RefinementContext",
-    "ValidationResult",
-]
+    "ContentRevision": ".editorial_models",
+    "EditorialAction": ".editorial_models",
+    "EditorialRequest": ".editorial_models",
+    "EditorialResponse": ".editorial_models",
+    "EditorialWorkflow": ".editorial_models",
+    "Feedback": ".editorial_models",
+    "FeedbackType": ".editorial_models",
+    "QualityMetrics": ".editorial_models",
+    "RefinementContext": ".editorial_models",
+    "ValidationResult": ".editorial_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+__all__ = list(_LAZY_IMPORTS)
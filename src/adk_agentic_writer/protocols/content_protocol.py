@@ -50,6 +50,17 @@ class ContentBlock:
     - Branching choices
     """
 
+    __slots__ = (
+        "block_id",
+        "block_type",
+        "content",
+        "pattern",
+        "navigation",
+        "exit_condition",
+        "choices",
+        "metadata",
+    )
+
     def __init__(
         self,
         block_id: str,
@@ -0,0 +1,107 @@
+"""Tests for backend middleware."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from adk_agentic_writer.backend.api import app as backend_app
+from adk_agentic_writer.backend.middleware import FastCORS, FastPaths, RequestID
+
+ORIGIN = "http://localhost:3000"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Provide a client for a small app behind FastCORS."""
+    app = FastAPI()
+    app.add_middleware(
+        FastCORS,
+        allow_origins=[ORIGIN],
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization"],
+    )
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_allowed_origin_gets_cors_headers(client: TestClient) -> None:
+    """Test simple requests from allowed origins are annotated."""
+    response = client.get("/ping", headers={"Origin": ORIGIN})
+
+    assert response.json() == {"ok": True}
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+    other = client.get("/ping", headers={"Origin": "http://example.com"})
+    assert other.status_code == 200
+    assert "access-control-allow-origin" not in other.headers
+
+
+@pytest.mark.parametrize(
+    "origin, method, headers, status",
+    [
+        (ORIGIN, "POST", "content-type, authorization", 200),
+        (ORIGIN, "DELETE", None, 400),
+        (ORIGIN, "POST", "x-custom", 400),
+        ("http://example.com", "GET", None, 400),
+    ],
+)
+def test_preflight(
+    client: TestClient, origin: str, method: str, headers: str, status: int
+) -> None:
+    """Test preflights are answered without reaching the app."""
+    request_headers = {"Origin": origin, "Access-Control-Request-Method": method}
+    if headers:
+        request_headers["Access-Control-Request-Headers"] = headers
+
+    response = client.options("/ping", headers=request_headers)
+
+    assert response.status_code == status
+    if status == 200:
+        assert response.headers["access-control-allow-origin"] == origin
+        assert response.headers["access-control-allow-methods"] == "GET, POST"
+
+
+def test_fast_paths_answer_origin_less_gets() -> None:
+    """Test fast paths skip the app unless the request carries an Origin."""
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"source": "app"}
+
+    client = TestClient(FastPaths(app, routes={"/health": lambda: b'{"source":"fast"}'}))
+
+    assert client.get("/health").json() == {"source": "fast"}
+    assert client.get("/health", headers={"Origin": ORIGIN}).json() == {"source": "app"}
+    assert client.post("/health").status_code == 405
+
+
+def test_request_id_is_reused_or_minted() -> None:
+    """Test valid upstream ids are echoed and others are replaced."""
+    app = FastAPI()
+
+    @app.get("/id")
+    async def request_id(request: Request):
+        return {"id": request.state.request_id}
+
+    client = TestClient(RequestID(app, id_factory=lambda: "minted"))
+
+    for sent, expected in ((None, "minted"), ("abc-123", "abc-123"), ("bad id!", "minted")):
+        headers = {"X-Request-ID": sent} if sent else {}
+        response = client.get("/id", headers=headers)
+        assert response.headers["x-request-id"] == expected
+        assert response.json() == {"id": expected}
+
+
+def test_backend_fast_paths_carry_request_id() -> None:
+    """Test status probes answered by FastPaths still get an X-Request-ID."""
+    response = TestClient(backend_app).get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["x-request-id"]
@@ -0,0 +1,96 @@
+"""Tests for the backend Gemini result cache."""
+
+import asyncio
+
+import pytest
+
+from adk_agentic_writer.backend import api
+from adk_agentic_writer.backend.api import GenerateRequest
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Replace the Gemini task runner with a slow recording stub."""
+    recorded = []
+    running = 0
+
+    async def fake_run(coordinator, request):
+        nonlocal running
+        running += 1
+        recorded.append((request.topic, running))
+        await asyncio.sleep(0.02)
+        running -= 1
+        if request.topic == "broken":
+            return {"error": "failed"}
+        return {"topic": request.topic}
+
+    monkeypatch.setattr(api, "_run_gemini_task", fake_run)
+    api._result_cache.clear()
+    yield recorded
+    api._result_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_generation(calls: list) -> None:
+    """Test identical requests are coalesced and then served from the cache."""
+    request = GenerateRequest(
+        team="gemini", content_type="quiz", topic="space", parameters={"a": 1, "b": 2}
+    )
+    reordered = GenerateRequest(
+        team="gemini", content_type="quiz", topic="space", parameters={"b": 2, "a": 1}
+    )
+
+    results = await asyncio.gather(
+        *(api._generate_gemini(None, request, True) for _ in range(3))
+    )
+    cached = await api._generate_gemini(None, reordered, True)
+
+    assert calls == [("space", 1)]
+    assert results == [{"topic": "space"}] * 3
+    assert cached == {"topic": "space"}
+    assert not api._result_locks
+
+
+@pytest.mark.asyncio
+async def test_errors_and_bypass_are_not_cached(calls: list) -> None:
+    """Test error results are not cached and use_cache=False skips the cache."""
+    broken = GenerateRequest(team="gemini", content_type="quiz", topic="broken")
+    fresh = GenerateRequest(team="gemini", content_type="quiz", topic="fresh")
+
+    await api._generate_gemini(None, broken, True)
+    await api._generate_gemini(None, broken, True)
+    await api._generate_gemini(None, fresh, False)
+
+    assert calls == [("broken", 1), ("broken", 1), ("fresh", 1)]
+    assert not api._result_cache
+
+
+@pytest.mark.asyncio
+async def test_uncached_results_stay_coalesced(calls: list) -> None:
+    """Test late identical requests still queue behind uncached generations."""
+    broken = GenerateRequest(team="gemini", content_type="quiz", topic="broken")
+
+    early = [
+        asyncio.create_task(api._generate_gemini(None, broken, True)) for _ in range(2)
+    ]
+    # The first generation has finished and the second is running
+    await asyncio.sleep(0.03)
+    late = asyncio.create_task(api._generate_gemini(None, broken, True))
+    await asyncio.gather(*early, late)
+
+    assert calls == [("broken", 1)] * 3
+    assert not api._result_locks
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_independent_copies(calls: list) -> None:
+    """Test changing a returned result does not change the cached one."""
+    request = GenerateRequest(team="gemini", content_type="quiz", topic="space")
+
+    first = await api._generate_gemini(None, request, True)
+    first["topic"] = "changed"
+    hit = await api._generate_gemini(None, request, True)
+    hit["extra"] = True
+
+    assert await api._generate_gemini(None, request, True) == {"topic": "space"}
+    assert calls == [("space", 1)]
@@ -0,0 +1,196 @@
+"""Tests for reviewer agent."""
+
+import pytest
+
+from adk_agentic_writer.agents.static.reviewer import ReviewerAgent
+
+
+@pytest.fixture
+def quiz_content() -> dict:
+    """Provide a small quiz to review."""
+    return {
+        "title": "Python Quiz",
+        "questions": [
+            {"question": "What is Python?", "correct_answer": 0, "explanation": "x"},
+            {"question": "What is a list?", "correct_answer": 1},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_evaluation_cached_by_content(quiz_content: dict) -> None:
+    """Test repeated evaluations of unchanged content hit the cache."""
+    agent = ReviewerAgent()
+
+    first = await agent._evaluate_criterion(quiz_content, "quiz", "clarity")
+    assert len(agent._evaluation_cache) == 1
+
+    # Mutating returned feedback must not leak into the cache
+    first[1].append("extra")
+    second = await agent._evaluate_criterion(quiz_content, "quiz", "clarity")
+    assert second[0] == first[0]
+    assert "extra" not in second[1]
+    assert len(agent._evaluation_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_evaluation_cache_bypassed_without_structure() -> None:
+    """Test content missing its structural keys is not cached."""
+    agent = ReviewerAgent()
+
+    await agent._evaluate_criterion({"title": "No questions"}, "quiz", "clarity")
+    assert len(agent._evaluation_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_review_hashes_content_once(
+    quiz_content: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a review digests its content once and tolerates unsortable keys."""
+    agent = ReviewerAgent()
+    digests = []
+    content_digest = agent._content_digest
+
+    def counting_digest(content: dict, content_type: str) -> bytes:
+        digests.append(content_type)
+        return content_digest(content, content_type)
+
+    monkeypatch.setattr(agent, "_content_digest", counting_digest)
+    criteria = {"content_type": "quiz", "criteria": ["clarity", "engagement", "accuracy"]}
+
+    await agent.review_content(quiz_content, criteria)
+    assert digests == ["quiz"]
+    assert len(agent._evaluation_cache) == 3
+
+    mixed_keys = {**quiz_content, "extra": {1: "a", "b": 2}}
+    review = await agent.review_content(mixed_keys, criteria)
+    assert set(review["scores"]) == {"clarity", "engagement", "accuracy"}
+    assert len(agent._evaluation_cache) == 3
+
+
+@pytest.mark.asyncio
+async def test_large_story_scan_matches_small_path() -> None:
+    """Test the vectorized scan agrees with the pure-Python scan."""
+    agent = ReviewerAgent()
+    nodes = {
+        f"n{i}": {
+            "branches": [{"text": "a"}, {"text": "b"}] if i % 2 else [],
+            "is_ending": i % 10 == 0,
+        }
+        for i in range(200)
+    }
+    small = dict(list(nodes.items())[:10])
+
+    large_score, _ = await agent._evaluate_story({"nodes": nodes}, "completeness", [])
+    small_score, _ = await agent._evaluate_story({"nodes": small}, "completeness", [])
+    assert large_score == 8.0
+    assert small_score == 7.5
+
+
+@pytest.mark.asyncio
+async def test_large_game_counts_mixed_rewards() -> None:
+    """Test reward variety is counted for large games with mixed reward types."""
+    agent = ReviewerAgent()
+    nodes = {f"n{i}": {"rewards": [i % 3, f"item{i % 2}"]} for i in range(300)}
+
+    score, feedback = await agent._evaluate_game({"nodes": nodes}, "engagement", ())
+
+    assert score == 8.0
+    assert feedback == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ({}, False),
+        ({"questions": []}, False),
+        ({"questions": [{"question": "Q"}]}, True),
+        ({"nodes": {}, "start_node": "start"}, True),
+        ({"nodes": {}, "start_node": "s", "victory_conditions": []}, True),
+        ({"variables": [], "controls": []}, True),
+        ({"title": "Plain"}, True),
+    ],
+)
+async def test_validate_content(content: dict, expected: bool) -> None:
+    """Test content validation across detected content types."""
+    agent = ReviewerAgent()
+
+    assert await agent.validate_content(content) is expected
+
+
+@pytest.mark.asyncio
+async def test_story_counters_for_large_graphs() -> None:
+    """Test branch and ending counts on graphs above the JIT threshold."""
+    agent = ReviewerAgent()
+    nodes = {
+        f"n{i}": {"branches": [{"text": "a"}], "is_ending": i == 0}
+        for i in range(300)
+    }
+
+    engagement, feedback = await agent._evaluate_story(
+        {"nodes": nodes}, "engagement", []
+    )
+    completeness, _ = await agent._evaluate_story({"nodes": nodes}, "completeness", [])
+    assert engagement == 7.0
+    assert "Add more branching points for interactivity" in feedback
+    assert completeness == 7.5
+
+
+@pytest.mark.asyncio
+async def test_review_batch_preserves_order(quiz_content: dict) -> None:
+    """Test batch reviews return one result per item in input order."""
+    agent = ReviewerAgent()
+    items = [quiz_content, {}, quiz_content]
+
+    results = await agent.review_batch(
+        items, {"content_type": "quiz", "criteria": ["clarity"]}, max_concurrency=2
+    )
+
+    assert len(results) == 3
+    assert results[0] == results[2]
+    assert results[1]["scores"]["clarity"] < results[0]["scores"]["clarity"]
+
+
+@pytest.mark.asyncio
+async def test_quiz_engagement_flags_repeated_questions() -> None:
+    """Test repeated question openings are flagged for engagement."""
+    agent = ReviewerAgent()
+    repeated = {"questions": [{"question": "What is the primary purpose?"}] * 3}
+    varied = {"questions": [{"question": f"Question {i}"} for i in range(3)]}
+
+    repeated_score, feedback = await agent._evaluate_quiz(repeated, "engagement", ())
+    varied_score, _ = await agent._evaluate_quiz(varied, "engagement", ())
+
+    assert repeated_score == 7.5
+    assert feedback == ["Vary question formats for better engagement"]
+    assert varied_score == 8.0
+
+
+@pytest.mark.asyncio
+async def test_refine_content_leaves_input_untouched() -> None:
+    """Test refinement overlays metadata without mutating the input."""
+    agent = ReviewerAgent()
+    content = {"title": "Story", "metadata": {"author": "test"}}
+
+    refined = await agent.refine_content(
+        content, {"suggestions": [{"area": "completeness"}, {"area": "clarity"}]}
+    )
+
+    assert refined["metadata"] == {
+        "author": "test",
+        "refined": True,
+        "refinement_applied": "completeness",
+        "clarity_improved": True,
+    }
+    assert content["metadata"] == {"author": "test"}
+    assert "metadata" not in await agent.refine_content({"title": "x"}, "tweak")
+
+
+@pytest.mark.asyncio
+async def test_validate_content_rejects_empty_content() -> None:
+    """Test missing or empty content is invalid rather than an error."""
+    agent = ReviewerAgent()
+
+    assert await agent.validate_content(None) is False
+    assert await agent.validate_content({}) is False
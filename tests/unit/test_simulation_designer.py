@@ -0,0 +1,34 @@
+"""Tests for simulation designer agent."""
+
+import pytest
+
+from adk_agentic_writer.agents.static.simulation_designer import (
+    SimulationDesignerAgent,
+)
+from adk_agentic_writer.protocols.content_protocol import ContentBlockType
+
+
+@pytest.mark.asyncio
+async def test_iter_sequential_blocks_matches_list() -> None:
+    """Test streamed sequential blocks match the collected list."""
+    context = {"topic": "physics"}
+
+    streamer = SimulationDesignerAgent()
+    streamer._rng.seed(1)
+    streamed = [
+        block
+        async for block in streamer.iter_sequential_blocks(
+            3, ContentBlockType.CUSTOM, context
+        )
+    ]
+
+    collector = SimulationDesignerAgent()
+    collector._rng.seed(1)
+    collected = await collector.generate_sequential_blocks(
+        3, ContentBlockType.CUSTOM, context
+    )
+
+    assert [b.block_id for b in streamed] == ["module_1", "module_2", "module_3"]
+    assert [b.content for b in streamed] == [b.content for b in collected]
+    assert streamed[0].navigation == {"next": "module_2", "prev": None}
+    assert streamed[-1].navigation == {"next": None, "prev": "module_2"}
@@ -0,0 +1,54 @@
+"""Tests for story writer agent."""
+
+import pytest
+
+from adk_agentic_writer.agents.static.story_writer import StoryWriterAgent
+
+
+@pytest.mark.parametrize("num_nodes", [-1, 1, 3, 5, 7])
+def test_story_data_matches_validated_narrative(num_nodes: int) -> None:
+    """Test the unvalidated story dict matches the BranchedNarrative dump."""
+    fast = StoryWriterAgent()
+    fast._rng.seed(3)
+    validated = StoryWriterAgent()
+    validated._rng.seed(3)
+
+    story = fast._generate_story_data("dragons", "fantasy", num_nodes)
+    expected = validated._generate_story_data(
+        "dragons", "fantasy", num_nodes, validate=True
+    )
+
+    assert story == expected
+    assert list(story) == list(expected)
+    assert story["nodes"]["start"]["tags"] == ["opening", "fantasy"]
+    assert story["start_node"] in story["nodes"]
+
+
+def test_story_data_always_includes_endings() -> None:
+    """Test every node budget, even a negative one, keeps the endings."""
+    agent = StoryWriterAgent()
+
+    for num_nodes in (-5, -1, 0, 1):
+        nodes = agent._generate_story_data("dragons", "fantasy", num_nodes)["nodes"]
+        assert list(nodes) == [
+            "start",
+            "victory_ending",
+            "alliance_ending",
+            "wisdom_ending",
+        ]
+
+
+def test_story_data_does_not_share_containers() -> None:
+    """Test generated stories never alias each other's mutable fields."""
+    agent = StoryWriterAgent()
+
+    first = agent._generate_story_data("dragons", "fantasy", 7)
+    first["metadata"]["edited"] = True
+    first["nodes"]["bold_path"]["branches"][0]["text"] = "changed"
+    first["nodes"]["victory_ending"]["tags"].append("extra")
+    second = agent._generate_story_data("dragons", "fantasy", 7)
+
+    assert second["metadata"] == {}
+    assert second["nodes"]["bold_path"]["branches"][0]["text"] == "Face the challenge"
+    assert second["nodes"]["victory_ending"]["tags"] == ["ending", "victory"]
+